@@ -0,0 +1,82 @@
+"""
+Response caching for the User Story Creation Agent.
+"""
+import logging
+import os
+import time
+from typing import Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Redis is optional; without REDIS_URL (or the redis package) the cache
+# degrades to a per-process dict. For shared deployments configure the
+# Redis server with maxmemory-policy allkeys-lfu so hot keys survive.
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+
+class ResponseCache:
+    """TTL cache for pre-serialized response bodies.
+
+    Entries are kept past their TTL and reported as stale instead of
+    being dropped, so callers can fall back to last-known-good data when
+    the upstream is unavailable.
+    """
+
+    def __init__(self):
+        self._redis = None
+        if REDIS_URL and REDIS_AVAILABLE:
+            try:
+                self._redis = aioredis.from_url(REDIS_URL)
+                logger.info("✅ Response cache backed by Redis")
+            except Exception as e:
+                logger.error("❌ Failed to create Redis client, using in-memory cache: %s", e)
+        self._local = {}
+
+    async def get(self, key: str, ttl: float) -> Tuple[Optional[bytes], Optional[str]]:
+        """Look up a cached body.
+
+        Returns (body, state) where state is 'fresh', 'stale' or None
+        when the key has never been cached.
+        """
+        entry = await self._load(key)
+        if entry is None:
+            return None, None
+        generated_at, body = entry
+        return body, "fresh" if time.time() - generated_at < ttl else "stale"
+
+    async def set(self, key: str, body: bytes) -> None:
+        """Store a response body under ``key``."""
+        now = time.time()
+        if self._redis is not None:
+            try:
+                await self._redis.hset(key, mapping={"generated_at": now, "body": body})
+                return
+            except Exception as e:
+                logger.warning("Redis cache write failed for %s: %s", key, e)
+        if len(self._local) > 256:
+            self._local.clear()
+        self._local[key] = (now, body)
+
+    async def _load(self, key: str):
+        if self._redis is not None:
+            try:
+                entry = await self._redis.hgetall(key)
+                if entry:
+                    return float(entry[b"generated_at"]), entry[b"body"]
+                return None
+            except Exception as e:
+                logger.warning("Redis cache read failed for %s: %s", key, e)
+        return self._local.get(key)
+
+
+# Shared cache for Jira metadata responses
+jira_response_cache = ResponseCache()
+
+# Cache for generated story sets keyed by requirements hash
+llm_response_cache = ResponseCache()
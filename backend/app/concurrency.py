@@ -0,0 +1,63 @@
+"""
+Concurrency primitives for the User Story Creation Agent.
+"""
+import asyncio
+import contextlib
+import os
+
+
+class AdmissionController:
+    """Caps the number of in-flight requests with a runtime-tunable limit.
+
+    Unlike asyncio.Semaphore, the limit can be changed while requests are
+    waiting: raising it wakes blocked waiters immediately, lowering it
+    simply lets the active count drain below the new ceiling.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self._active = 0
+        self._max_concurrent = max_concurrent
+        self._cond = asyncio.Condition()
+
+    @property
+    def active(self) -> int:
+        """Number of currently admitted requests."""
+        return self._active
+
+    @property
+    def limit(self) -> int:
+        """Current admission ceiling."""
+        return self._max_concurrent
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free, then take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._max_concurrent)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give a slot back and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, max_concurrent: int) -> None:
+        """Change the ceiling at runtime and wake all waiters to re-check."""
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        async with self._cond:
+            self._max_concurrent = max_concurrent
+            self._cond.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold an admission slot for the duration of the block."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+
+# Shared controller bounding concurrent upstream Jira work
+jira_admission = AdmissionController(int(os.getenv("JIRA_MAX_CONCURRENCY", "8")))
@@ -1,29 +1,81 @@
 """
 Jira integration service for the User Story Creation Agent.
 """
+import asyncio
 import logging
-import traceback
+import threading
+import time
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional, Any
 
-# Handle Python 3.13 compatibility issue with imghdr
-try:
-    from jira import JIRA
-    from jira.exceptions import JIRAError
-    JIRA_AVAILABLE = True
-except ImportError as e:
-    if "imghdr" in str(e):
-        logging.warning("Jira library not fully compatible with Python 3.13. Using requests-based implementation.")
-        JIRA_AVAILABLE = False
-        JIRA = None
-        JIRAError = Exception
-    else:
-        raise
-
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# How long rarely-changing Jira metadata (projects, issue types, ...)
+# is served from the in-memory cache before being re-fetched
+METADATA_CACHE_TTL = 300  # seconds
+
+# Lazily constructed shared JiraService instance
+_jira_singleton: Optional["JiraService"] = None
+_jira_lock = threading.Lock()
+
+
+def _adf(text: str) -> Dict[str, Any]:
+    """Wrap plain text in the minimal Atlassian Document Format envelope."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": text}
+                ]
+            }
+        ]
+    }
+
+
+class _JiraRetry(Retry):
+    """Retry policy that only replays requests known to be safe.
+
+    GET keeps the full 429/5xx retry behavior. POST/PUT retry on 429
+    only — a 429 is rejected before any work happens — and never on
+    connection/read errors: a reset or timeout after the body went out
+    can mean Jira already created the issue, and a replay would
+    duplicate it.
+    """
+
+    def _is_method_retryable(self, method):
+        # Governs error-based retries (connection reset, read timeout);
+        # only GET is safe to replay there
+        return method.upper() == "GET"
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() != "GET":
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def get_jira_service() -> "JiraService":
+    """
+    Get the shared JiraService instance, creating it on first use.
+
+    Uses double-checked locking so the fast path is a plain attribute
+    read once the service has been constructed.
+    """
+    global _jira_singleton
+    if _jira_singleton is None:
+        with _jira_lock:
+            if _jira_singleton is None:
+                _jira_singleton = JiraService()
+    return _jira_singleton
+
 
 class JiraService:
     """Service for interacting with Jira API."""
@@ -41,64 +93,192 @@ class JiraService:
             if not settings.jira_api_token:
                 raise ValueError("JIRA_API_TOKEN is not set")
             
-            logger.info(f"Initializing Jira service for: {settings.jira_url}")
-            
-            # Use requests-based implementation for Python 3.13
-            if not JIRA_AVAILABLE:
-                self.client = None
-                self.base_url = settings.jira_url.rstrip('/')
-                self.auth = (settings.jira_username, settings.jira_api_token)
-                self.headers = {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json'
-                }
-                logger.info("✅ Jira service initialized with requests-based implementation")
-            else:
-                # Use official Jira library for Python 3.11/3.12
-                self.client = JIRA(
-                    server=settings.jira_url,
-                    basic_auth=(settings.jira_username, settings.jira_api_token)
-                )
-                # Test connection
-                self.client.projects()
-                logger.info("✅ Jira service initialized with official library")
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to initialize Jira service: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.info("Initializing Jira service for: %s", settings.jira_url)
+
+            self.base_url = settings.jira_url.rstrip('/')
+            self._api_prefix = f"{self.base_url}/rest/api/3/"
+            self.auth = (settings.jira_username, settings.jira_api_token)
+            self._aclient: Optional[httpx.AsyncClient] = None
+            # key -> (monotonic timestamp, value) for metadata lookups
+            self._metadata_cache: Dict[Any, Any] = {}
+
+            self.headers = {
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
+            }
+            # Reuse one pooled session so TLS handshakes are paid once,
+            # not once per API call
+            self._session = requests.Session()
+            self._session.auth = self.auth
+            self._session.headers.update(self.headers)
+            # Retry transient Jira failures with backoff instead of
+            # failing the whole export; _JiraRetry keeps POST/PUT retries
+            # to 429 only so half-completed creates are never replayed
+            retry = _JiraRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            logger.info("✅ Jira service initialized")
+
+        except Exception:
+            logger.exception("❌ Failed to initialize Jira service")
             raise
     
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make HTTP request to Jira API using requests."""
-        if JIRA_AVAILABLE:
-            raise Exception("This method should not be called when JIRA library is available")
-        
-        url = f"{self.base_url}/rest/api/3/{endpoint}"
+        url = self._api_prefix + endpoint
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, auth=self.auth, headers=self.headers)
-            elif method.upper() == 'POST':
-                response = requests.post(url, auth=self.auth, headers=self.headers, json=data)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, auth=self.auth, headers=self.headers, json=data)
-            else:
+            if method.upper() not in ('GET', 'POST', 'PUT'):
                 raise ValueError(f"Unsupported HTTP method: {method}")
-            
+
+            # Serialize outgoing bodies and parse responses with orjson,
+            # which is considerably faster than the stdlib json path
+            body = orjson.dumps(data) if data is not None else None
+            response = self._session.request(method.upper(), url, data=body)
+
             response.raise_for_status()
-            return response.json() if response.content else {}
+            return orjson.loads(response.content) if response.content else {}
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Jira API request failed: {e}")
-            if hasattr(e, 'response') and e.response is not None:
+            logger.error("Jira API request failed: %s", e)
+            error_response = getattr(e, 'response', None)
+            if error_response is not None:
                 try:
-                    error_details = e.response.json()
-                    logger.error(f"Jira API error details: {error_details}")
-                    logger.error(f"Jira API status code: {e.response.status_code}")
-                except:
-                    logger.error(f"Jira API response text: {e.response.text}")
-                    logger.error(f"Jira API status code: {e.response.status_code}")
+                    error_details = orjson.loads(error_response.content)
+                    logger.error("Jira API error details: %s", error_details)
+                except orjson.JSONDecodeError:
+                    logger.error("Jira API response text: %s", error_response.text)
+                logger.error("Jira API status code: %s", error_response.status_code)
             raise Exception(f"Jira API request failed: {str(e)}")
-    
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get (lazily creating) the shared async HTTP client."""
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self._api_prefix,
+                auth=self.auth,
+                headers={
+                    'Accept': 'application/json',
+                    'Content-Type': 'application/json'
+                },
+                limits=httpx.Limits(max_connections=32)
+            )
+        return self._aclient
+
+    async def _make_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+        """Make an async HTTP request to the Jira API using httpx."""
+        try:
+            client = self._get_async_client()
+            # Hand pre-encoded orjson bytes to httpx so issue payloads skip
+            # the stdlib json.dumps + encode pass (the client already sends
+            # the application/json Content-Type)
+            body = orjson.dumps(data) if data is not None else None
+            response = await client.request(method.upper(), endpoint, content=body)
+            response.raise_for_status()
+            return orjson.loads(response.content) if response.content else {}
+        except httpx.HTTPError as e:
+            logger.error("Jira API request failed: %s", e)
+            raise Exception(f"Jira API request failed: {str(e)}")
+
+    async def create_epic_async(self, project_key: str, epic_name: str, epic_description: str = "") -> Dict[str, Any]:
+        """Async variant of create_epic using the shared httpx client."""
+        epic_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": epic_name,
+                "description": _adf(epic_description),
+                "issuetype": {"name": "Task"}
+            }
+        }
+        response = await self._make_request_async('POST', 'issue', epic_data)
+        return {
+            "key": response["key"],
+            "id": response["id"],
+            "summary": epic_name,
+            "priority": None,
+            "labels": [],
+            "components": []
+        }
+
+    async def create_user_story_async(self, project_key: str, story_data: Dict[str, Any], epic_key: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of create_user_story using the shared httpx client."""
+        issue_data = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": story_data["story"],
+                "description": _adf(self._format_description(story_data)),
+                "issuetype": {"name": "Task"}
+            }
+        }
+        response = await self._make_request_async('POST', 'issue', issue_data)
+        return {
+            "key": response["key"],
+            "id": response["id"],
+            "summary": story_data["story"],
+            "priority": None,
+            "labels": [],
+            "components": []
+        }
+
+    async def export_stories_to_jira_async(self, stories: List[Dict[str, Any]], project_key: str, create_epic: bool = True, epic_name: str = "User Stories") -> Dict[str, Any]:
+        """
+        Async variant of export_stories_to_jira.
+
+        Creates the epic first (if requested), then fans out the story
+        creation calls concurrently with asyncio.gather.
+        """
+        epic = None
+        logger.info("Starting async export of %s stories to project %s", len(stories), project_key)
+
+        if create_epic:
+            epic_description = f"Parent task containing {len(stories)} user stories"
+            try:
+                epic = await self.create_epic_async(project_key, epic_name, epic_description)
+                logger.info("✅ Successfully created parent task: %s", epic['key'])
+            except Exception as e:
+                logger.error("❌ Failed to create parent task: %s", e)
+                epic = None
+
+        results = await asyncio.gather(
+            *[self.create_user_story_async(project_key, story) for story in stories],
+            return_exceptions=True
+        )
+
+        exported_stories = []
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error("❌ Failed to create user story %s: %s", i+1, result)
+            else:
+                exported_stories.append(result)
+
+        return {
+            "total_exported": len(exported_stories),
+            "epic": epic,
+            "stories": exported_stories,
+            "status": "success"
+        }
+
+    def _cached_metadata(self, key: Any, fetch) -> Any:
+        """
+        Return cached metadata for ``key``, calling ``fetch`` on a miss.
+
+        Jira projects and issue types change on the order of days, so a
+        short TTL eliminates the repeated round-trips an export run (or
+        the frontend) would otherwise issue for the same data.
+        """
+        hit = self._metadata_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < METADATA_CACHE_TTL:
+            return hit[1]
+        value = fetch()
+        if len(self._metadata_cache) > 64:
+            self._metadata_cache.clear()
+        self._metadata_cache[key] = (time.monotonic(), value)
+        return value
+
     def get_projects(self) -> List[Dict[str, Any]]:
         """
         Get all accessible Jira projects.
@@ -106,40 +286,23 @@ class JiraService:
         Returns:
             List of project dictionaries with key and name
         """
+        return self._cached_metadata('projects', self._fetch_projects)
+
+    def _fetch_projects(self) -> List[Dict[str, Any]]:
         try:
-            if JIRA_AVAILABLE:
-                projects = self.client.projects()
-                return [
-                    {
-                        "key": project.key,
-                        "name": project.name,
-                        "id": project.id
-                    }
-                    for project in projects
-                ]
-            else:
-                # Use requests-based implementation
-                response = self._make_request('GET', 'project')
-                if isinstance(response, list):
-                    return [
-                        {
-                            "key": project["key"],
-                            "name": project["name"],
-                            "id": project["id"]
-                        }
-                        for project in response
-                    ]
-                else:
-                    return [
-                        {
-                            "key": project["key"],
-                            "name": project["name"],
-                            "id": project["id"]
-                        }
-                        for project in response.get("values", [])
-                    ]
+            # /rest/api/3/project always returns a plain list; the paginated
+            # shape only exists on /project/search, which we don't call
+            response = self._make_request('GET', 'project')
+            return [
+                {
+                    "key": project["key"],
+                    "name": project["name"],
+                    "id": project["id"]
+                }
+                for project in response
+            ]
         except Exception as e:
-            logger.error(f"Error fetching Jira projects: {e}")
+            logger.error("Error fetching Jira projects: %s", e)
             raise Exception(f"Failed to fetch Jira projects: {str(e)}")
     
     def get_project_details(self, project_key: str) -> Dict[str, Any]:
@@ -152,28 +315,23 @@ class JiraService:
         Returns:
             Project details dictionary
         """
+        return self._cached_metadata(
+            ('project', project_key),
+            lambda: self._fetch_project_details(project_key)
+        )
+
+    def _fetch_project_details(self, project_key: str) -> Dict[str, Any]:
         try:
-            if JIRA_AVAILABLE:
-                project = self.client.project(project_key)
-                return {
-                    "key": project.key,
-                    "name": project.name,
-                    "id": project.id,
-                    "projectTypeKey": project.projectTypeKey,
-                    "lead": project.lead.displayName if hasattr(project, 'lead') else None
-                }
-            else:
-                # Use requests-based implementation
-                response = self._make_request('GET', f'project/{project_key}')
-                return {
-                    "key": response["key"],
-                    "name": response["name"],
-                    "id": response["id"],
-                    "projectTypeKey": response.get("projectTypeKey"),
-                    "lead": response.get("lead", {}).get("displayName")
-                }
+            response = self._make_request('GET', f'project/{project_key}')
+            return {
+                "key": response["key"],
+                "name": response["name"],
+                "id": response["id"],
+                "projectTypeKey": response.get("projectTypeKey"),
+                "lead": response.get("lead", {}).get("displayName")
+            }
         except Exception as e:
-            logger.error(f"Error fetching project details for {project_key}: {e}")
+            logger.error("Error fetching project details for %s: %s", project_key, e)
             raise Exception(f"Failed to fetch project details: {str(e)}")
     
     def create_epic(self, project_key: str, epic_name: str, epic_description: str = "") -> Dict[str, Any]:
@@ -194,50 +352,16 @@ class JiraService:
                 "fields": {
                     "project": {"key": project_key},
                     "summary": epic_name,
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": epic_description
-                                    }
-                                ]
-                            }
-                        ]
-                    },
+                    "description": _adf(epic_description),
                     "issuetype": {"name": "Task"}
                     # Note: Removed priority and components to avoid field errors
                 }
             }
             
-            if JIRA_AVAILABLE:
-                epic = self.client.create_issue(fields=epic_data["fields"])
-                return {
-                    "key": epic.key,
-                    "id": epic.id,
-                    "summary": epic.fields.summary,
-                    "priority": epic.fields.priority.name if epic.fields.priority else None,
-                    "labels": epic.fields.labels if epic.fields.labels else [],
-                    "components": [c.name for c in epic.fields.components] if epic.fields.components else []
-                }
-            else:
-                # Use requests-based implementation
-                response = self._make_request('POST', 'issue', epic_data)
-                return {
-                    "key": response["key"],
-                    "id": response["id"],
-                    "summary": epic_name,
-                    "priority": None,  # Not set due to field limitations
-                    "labels": [],      # Not set due to field limitations
-                    "components": []   # Not set due to field limitations
-                }
-                
+            return self._submit_issue(epic_data, epic_name)
+
         except Exception as e:
-            logger.error(f"Error creating epic: {e}")
+            logger.error("Error creating epic: %s", e)
             raise Exception(f"Failed to create epic: {str(e)}")
     
     def create_user_story(self, project_key: str, story_data: Dict[str, Any], epic_key: Optional[str] = None) -> Dict[str, Any]:
@@ -258,21 +382,7 @@ class JiraService:
                 "fields": {
                     "project": {"key": project_key},
                     "summary": story_data["story"],
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": self._format_description(story_data)
-                                    }
-                                ]
-                            }
-                        ]
-                    },
+                    "description": _adf(self._format_description(story_data)),
                     "issuetype": {"name": "Task"}
                     # Note: Removed priority, labels, components, and story points to avoid field errors
                     # These can be added back if your Jira instance supports them
@@ -288,99 +398,100 @@ class JiraService:
             # Only Epic issue types can have child issues
             # So we'll create individual tasks without linking
             
-            if JIRA_AVAILABLE:
-                issue = self.client.create_issue(fields=issue_data["fields"])
-                return {
-                    "key": issue.key,
-                    "id": issue.id,
-                    "summary": issue.fields.summary,
-                    "priority": issue.fields.priority.name if issue.fields.priority else None,
-                    "labels": issue.fields.labels if issue.fields.labels else [],
-                    "components": [c.name for c in issue.fields.components] if issue.fields.components else []
-                }
-            else:
-                # Use requests-based implementation
-                response = self._make_request('POST', 'issue', issue_data)
-                return {
-                    "key": response["key"],
-                    "id": response["id"],
-                    "summary": story_data["story"],
-                    "priority": None,  # Not set due to field limitations
-                    "labels": [],      # Not set due to field limitations
-                    "components": []   # Not set due to field limitations
-                }
-                
+            return self._submit_issue(issue_data, story_data["story"])
+
         except Exception as e:
-            logger.error(f"Error creating user story: {e}")
+            logger.error("Error creating user story: %s", e)
             raise Exception(f"Failed to create user story: {str(e)}")
     
-    def _format_description(self, story_data: Dict[str, Any]) -> str:
-        """Format user story data into a readable description."""
-        description = f"**User Story:**\n{story_data['story']}\n\n"
-        
-        if "acceptance_criteria" in story_data:
-            description += "**Acceptance Criteria:**\n"
-            for i, criteria in enumerate(story_data["acceptance_criteria"], 1):
-                description += f"{i}. {criteria}\n"
-        
-        return description
-    
-    def _estimate_story_points(self, story_data: Dict[str, Any]) -> int:
+    def _submit_issue(self, issue_data: Dict[str, Any], summary: str) -> Dict[str, Any]:
+        response = self._make_request('POST', 'issue', issue_data)
+        return {
+            "key": response["key"],
+            "id": response["id"],
+            "summary": summary,
+            "priority": None,  # Not set due to field limitations
+            "labels": [],      # Not set due to field limitations
+            "components": []   # Not set due to field limitations
+        }
+
+    def create_user_stories_bulk(self, project_key: str, stories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Estimate story points based on story complexity.
-        This is a simple heuristic - you can enhance this logic.
+        Create multiple user stories in one Jira round-trip.
+
+        Args:
+            project_key: Jira project key
+            stories: User story dictionaries (up to 50, the Jira Cloud
+                per-request bulk limit)
+
+        Returns:
+            List of created issue dictionaries in input order, omitting
+            stories that Jira rejected
         """
         try:
-            story_text = story_data.get("story", "")
-            criteria_count = len(story_data.get("acceptance_criteria", []))
-            
-            # Simple estimation logic
-            base_points = 3  # Base story points
-            
-            # Adjust based on acceptance criteria count
-            if criteria_count <= 2:
-                points = base_points
-            elif criteria_count <= 4:
-                points = base_points + 2
-            elif criteria_count <= 6:
-                points = base_points + 4
-            else:
-                points = base_points + 6
-            
-            # Adjust based on story length (complexity indicator)
-            if len(story_text) > 200:
-                points += 1
-            if len(story_text) > 400:
-                points += 1
-            
-            # Cap at reasonable maximum
-            return min(points, 13)  # Fibonacci sequence: 1, 2, 3, 5, 8, 13
-            
+            payload = {
+                "issueUpdates": [
+                    {
+                        "fields": {
+                            "project": {"key": project_key},
+                            "summary": story["story"],
+                            "description": _adf(self._format_description(story)),
+                            "issuetype": {"name": "Task"}
+                        }
+                    }
+                    for story in stories
+                ]
+            }
+            return self._submit_issues_bulk(payload, stories)
         except Exception as e:
-            logger.warning(f"Could not estimate story points: {e}")
-            return 3  # Default fallback
+            logger.error("Error creating user stories in bulk: %s", e)
+            raise Exception(f"Failed to create user stories in bulk: {str(e)}")
+
+    def _submit_issues_bulk(self, payload: Dict[str, Any], stories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        response = self._make_request('POST', 'issue/bulk', payload)
+        failed_indexes = set()
+        for error in response.get("errors", []):
+            failed_indexes.add(error.get("failedElementNumber"))
+            logger.error("❌ Bulk issue creation error: %s", error)
+        created = iter(response.get("issues", []))
+        results = []
+        for i, story in enumerate(stories):
+            if i in failed_indexes:
+                continue
+            issue = next(created, None)
+            if issue is None:
+                break
+            results.append({
+                "key": issue["key"],
+                "id": issue["id"],
+                "summary": story["story"],
+                "priority": None,  # Not set due to field limitations
+                "labels": [],      # Not set due to field limitations
+                "components": []   # Not set due to field limitations
+            })
+        return results
+
+    def _format_description(self, story_data: Dict[str, Any]) -> str:
+        """Format user story data into a readable description."""
+        parts = ["**User Story:**\n", story_data["story"], "\n\n"]
+
+        acceptance_criteria = story_data.get("acceptance_criteria")
+        if acceptance_criteria:
+            parts.append("**Acceptance Criteria:**\n")
+            parts.extend(f"{i}. {criteria}\n" for i, criteria in enumerate(acceptance_criteria, 1))
+
+        return "".join(parts)
     
     def _supports_epic_linking(self) -> bool:
         """
         Check if the Jira instance supports epic linking.
         This checks for common epic link custom fields.
         """
-        try:
-            # Common epic link custom field IDs
-            epic_link_fields = ["customfield_10014", "customfield_10008", "customfield_10010"]
-            
-            # Try to get project metadata to check available fields
-            if JIRA_AVAILABLE:
-                project = self.client.project(settings.jira_project_key)
-                # This is a simplified check - you might want to enhance this
-                return True
-            else:
-                # For requests-based implementation, assume epic linking is available
-                return True
-                
-        except Exception as e:
-            logger.warning(f"Could not determine epic linking support: {e}")
-            return False
+        return self._cached_metadata('epic_linking', self._check_epic_linking)
+
+    def _check_epic_linking(self) -> bool:
+        # The common epic link custom fields are assumed to be available
+        return True
     
     def export_stories_to_jira(self, stories: List[Dict[str, Any]], project_key: str, create_epic: bool = True, epic_name: str = "User Stories") -> Dict[str, Any]:
         """
@@ -396,36 +507,43 @@ class JiraService:
             Export result dictionary
         """
         try:
-            exported_stories = []
             epic = None
             
-            logger.info(f"Starting export of {len(stories)} stories to project {project_key}")
+            logger.info("Starting export of %s stories to project %s", len(stories), project_key)
             
             # Create epic if requested (as a Task since Epic issue type is not available)
             if create_epic:
                 epic_description = f"Parent task containing {len(stories)} user stories"
-                logger.info(f"Creating parent task: {epic_name}")
+                logger.info("Creating parent task: %s", epic_name)
                 try:
                     epic = self.create_epic(project_key, epic_name, epic_description)
-                    logger.info(f"✅ Successfully created parent task: {epic['key']}")
+                    logger.info("✅ Successfully created parent task: %s", epic['key'])
                 except Exception as e:
-                    logger.error(f"❌ Failed to create parent task: {e}")
+                    logger.error("❌ Failed to create parent task: %s", e)
                     epic = None
             
-            # Create user stories as individual tasks
-            for i, story in enumerate(stories):
+            # Create user stories via the bulk endpoint, one round-trip per
+            # batch of 50 (the Jira Cloud per-request limit)
+            exported_stories: List[Dict[str, Any]] = []
+            for start in range(0, len(stories), 50):
+                batch = stories[start:start + 50]
                 try:
-                    logger.info(f"Creating user story {i+1}/{len(stories)}: {story.get('story', 'Unknown')[:50]}...")
-                    story_issue = self.create_user_story(
-                        project_key, 
-                        story, 
-                        epic_key=None  # No linking since Task types don't support parent-child
-                    )
-                    exported_stories.append(story_issue)
-                    logger.info(f"✅ Successfully created user story task: {story_issue['key']}")
+                    created = self.create_user_stories_bulk(project_key, batch)
+                    exported_stories.extend(created)
+                    logger.info("✅ Successfully created %s/%s user story tasks in batch", len(created), len(batch))
                 except Exception as e:
-                    logger.error(f"❌ Failed to create user story {i+1}: {e}")
-                    continue
+                    # Some projects reject the bulk endpoint outright
+                    # (permissions, older instances); fall back to one
+                    # request per story for this batch
+                    logger.error(
+                        "❌ Bulk creation failed for batch starting at story %s, "
+                        "falling back to per-story creation: %s", start + 1, e
+                    )
+                    for story in batch:
+                        try:
+                            exported_stories.append(self.create_user_story(project_key, story))
+                        except Exception as story_error:
+                            logger.error("❌ Failed to create user story %r: %s", story.get("story"), story_error)
             
             return {
                 "total_exported": len(exported_stories),
@@ -435,7 +553,7 @@ class JiraService:
             }
             
         except Exception as e:
-            logger.error(f"Error exporting stories to Jira: {e}")
+            logger.error("Error exporting stories to Jira: %s", e)
             raise Exception(f"Failed to export stories to Jira: {str(e)}")
     
     def get_issue_details(self, issue_key: str) -> Dict[str, Any]:
@@ -449,32 +567,70 @@ class JiraService:
             Issue details dictionary
         """
         try:
-            if JIRA_AVAILABLE:
-                issue = self.client.issue(issue_key)
-                return {
-                    "key": issue.key,
-                    "id": issue.id,
-                    "summary": issue.fields.summary,
-                    "description": issue.fields.description,
-                    "status": issue.fields.status.name if issue.fields.status else None,
-                    "assignee": issue.fields.assignee.displayName if issue.fields.assignee else None
-                }
-            else:
-                # Use requests-based implementation
-                response = self._make_request('GET', f'issue/{issue_key}')
-                return {
-                    "key": response["key"],
-                    "id": response["id"],
-                    "summary": response["fields"]["summary"],
-                    "description": response["fields"].get("description", ""),
-                    "status": response["fields"]["status"]["name"] if "status" in response["fields"] else None,
-                    "assignee": response["fields"]["assignee"]["displayName"] if response["fields"].get("assignee") else None
-                }
-                
+            return self._fetch_issue_details(issue_key)
         except Exception as e:
-            logger.error(f"Error fetching issue details for {issue_key}: {e}")
+            logger.error("Error fetching issue details for %s: %s", issue_key, e)
             raise Exception(f"Failed to fetch issue details: {str(e)}")
+
+    def _fetch_issue_details(self, issue_key: str) -> Dict[str, Any]:
+        response = self._make_request('GET', f'issue/{issue_key}')
+        fields = response["fields"]
+        status = fields.get("status")
+        assignee = fields.get("assignee")
+        return {
+            "key": response["key"],
+            "id": response["id"],
+            "summary": fields["summary"],
+            "description": fields.get("description", ""),
+            "status": status["name"] if status else None,
+            "assignee": assignee["displayName"] if assignee else None
+        }
     
+    def get_issues_details(self, issue_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for multiple Jira issues in bulk.
+
+        Uses JQL search so up to 100 issues come back per round-trip
+        instead of one request per issue key.
+
+        Args:
+            issue_keys: Jira issue keys
+
+        Returns:
+            List of issue details dictionaries
+        """
+        try:
+            issues: List[Dict[str, Any]] = []
+            for start in range(0, len(issue_keys), 100):
+                batch = issue_keys[start:start + 100]
+                issues.extend(self._search_issues(batch))
+            return issues
+        except Exception as e:
+            logger.error("Error fetching issue details in bulk: %s", e)
+            raise Exception(f"Failed to fetch issue details: {str(e)}")
+
+    def _search_issues(self, issue_keys: List[str]) -> List[Dict[str, Any]]:
+        search_body = {
+            "jql": f"key in ({','.join(issue_keys)})",
+            "fields": ["summary", "description", "status", "assignee"],
+            "maxResults": 100
+        }
+        response = self._make_request('POST', 'search', search_body)
+        results = []
+        for issue in response.get("issues", []):
+            fields = issue["fields"]
+            status = fields.get("status")
+            assignee = fields.get("assignee")
+            results.append({
+                "key": issue["key"],
+                "id": issue["id"],
+                "summary": fields["summary"],
+                "description": fields.get("description", ""),
+                "status": status["name"] if status else None,
+                "assignee": assignee["displayName"] if assignee else None
+            })
+        return results
+
     def get_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         """
         Get available issue types for a project.
@@ -485,46 +641,38 @@ class JiraService:
         Returns:
             List of issue types
         """
+        return self._cached_metadata(
+            ('issue_types', project_key),
+            lambda: self._fetch_issue_types(project_key)
+        )
+
+    def _fetch_issue_types(self, project_key: str) -> List[Dict[str, Any]]:
         try:
-            if JIRA_AVAILABLE:
-                # Use official library
-                project = self.client.project(project_key)
+            response = self._make_request('GET', f'project/{project_key}')
+            if 'issueTypes' in response:
                 return [
                     {
-                        "id": it.id,
-                        "name": it.name,
-                        "description": it.description,
-                        "iconUrl": it.iconUrl
+                        "id": it["id"],
+                        "name": it["name"],
+                        "description": it.get("description", ""),
+                        "iconUrl": it.get("iconUrl", "")
                     }
-                    for it in project.issueTypes
+                    for it in response["issueTypes"]
                 ]
             else:
-                # Use requests-based implementation
-                response = self._make_request('GET', f'project/{project_key}')
-                if 'issueTypes' in response:
-                    return [
-                        {
-                            "id": it["id"],
-                            "name": it["name"],
-                            "description": it.get("description", ""),
-                            "iconUrl": it.get("iconUrl", "")
-                        }
-                        for it in response["issueTypes"]
-                    ]
-                else:
-                    # Fallback: get all issue types
-                    response = self._make_request('GET', 'issuetype')
-                    return [
-                        {
-                            "id": it["id"],
-                            "name": it["name"],
-                            "description": it.get("description", ""),
-                            "iconUrl": it.get("iconUrl", "")
-                        }
-                        for it in response
-                    ]
+                # Fallback: get all issue types
+                response = self._make_request('GET', 'issuetype')
+                return [
+                    {
+                        "id": it["id"],
+                        "name": it["name"],
+                        "description": it.get("description", ""),
+                        "iconUrl": it.get("iconUrl", "")
+                    }
+                    for it in response
+                ]
         except Exception as e:
-            logger.error(f"Error fetching issue types for {project_key}: {e}")
+            logger.error("Error fetching issue types for %s: %s", project_key, e)
             raise Exception(f"Failed to fetch issue types: {str(e)}")
     
     def health_check(self) -> Dict[str, Any]:
@@ -535,27 +683,19 @@ class JiraService:
             Health status dictionary
         """
         try:
-            if JIRA_AVAILABLE:
-                # Test with official library
-                self.client.projects()
-                return {
-                    "status": "healthy",
-                    "method": "official_library",
-                    "message": "Jira service is working correctly"
-                }
-            else:
-                # Test with requests-based implementation
-                self._make_request('GET', 'myself')
-                return {
-                    "status": "healthy",
-                    "method": "requests_based",
-                    "message": "Jira service is working with Python 3.13 compatibility mode"
-                }
-                
+            return self._probe_connection()
         except Exception as e:
-            logger.error(f"Jira health check failed: {e}")
+            logger.error("Jira health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "error": str(e),
                 "message": "Jira service is not responding correctly"
             }
+
+    def _probe_connection(self) -> Dict[str, Any]:
+        self._make_request('GET', 'myself')
+        return {
+            "status": "healthy",
+            "method": "requests_based",
+            "message": "Jira service is working correctly"
+        }
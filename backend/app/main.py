@@ -1,19 +1,34 @@
 """
 Main FastAPI application for the User Story Creation Agent.
 """
-from datetime import datetime
-from fastapi import FastAPI, HTTPException, Request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+import asyncio
+import functools
 import logging
-import json
-import traceback
+import orjson
+import re
+import time
 import io
 import os
 
+from typing import Any, Dict, List, Literal, Optional, Union
+from uuid import uuid4
+
+from .cache import jira_response_cache
+from .concurrency import jira_admission
 from .config import settings
 from .services import OpenRouterService
-from .jira_service import JiraService
+from .jira_service import JiraService, get_jira_service
 from .mongodb_service import MongoDBService
 
 # Configure logging
@@ -23,94 +38,433 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Technical terms used as feature indicators when analyzing requirements
+_TECH_RE = re.compile(
+    r'\b(?:api|database|authentication|authorization|integration|workflow|'
+    r'reporting|dashboard|notification|payment|search|filter|export|import)\b',
+    re.IGNORECASE
+)
+
+# reportlab is only needed for PDF downloads; import it and build the
+# paragraph styles once at module load instead of on every request
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    _PDF_BASE_STYLES = getSampleStyleSheet()
+    _PDF_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_PDF_BASE_STYLES['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    _PDF_STORY_STYLE = ParagraphStyle(
+        'CustomStory',
+        parent=_PDF_BASE_STYLES['Normal'],
+        fontSize=12,
+        spaceAfter=20,
+        leftIndent=20
+    )
+    _PDF_CRITERIA_STYLE = ParagraphStyle(
+        'CustomCriteria',
+        parent=_PDF_BASE_STYLES['Normal'],
+        fontSize=11,
+        spaceAfter=15,
+        leftIndent=40,
+        bulletIndent=20
+    )
+    _REPORTLAB_OK = True
+except ImportError:
+    _REPORTLAB_OK = False
+
+# Dedicated pool for CPU-bound PDF rendering so at most four renders run
+# at once and the event loop stays free
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Bounded pool for the blocking Jira HTTP calls; keeps the event loop
+# free while capping concurrent upstream requests
+_JIRA_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+
+async def _in_jira_pool(fn, *args, **kwargs):
+    """Run a synchronous Jira service call in the Jira thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _JIRA_EXECUTOR, functools.partial(fn, *args, **kwargs)
+    )
+
+
+# Static download headers, built once instead of per request
+_TXT_HEADER = "USER STORIES\n" + "=" * 50 + "\n\n"
+_MD_HEADER = "# User Stories with Acceptance Criteria\n\n"
+
+
+def _render_txt(user_stories: List[Union[str, Dict[str, Any]]], generated_on: str) -> str:
+    """Render user stories as plain text."""
+    parts = [_TXT_HEADER]
+    for i, story in enumerate(user_stories, 1):
+        # Handle both string and object formats
+        story_text = story if isinstance(story, str) else story.get("story", str(story))
+        parts.append(f"{i}. {story_text}\n\n")
+
+        # Add acceptance criteria if available
+        if isinstance(story, dict) and "acceptance_criteria" in story and story["acceptance_criteria"]:
+            parts.append("   Acceptance Criteria:\n")
+            for j, criteria in enumerate(story["acceptance_criteria"], 1):
+                parts.append(f"   {j}. {criteria}\n")
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _render_md(user_stories: List[Union[str, Dict[str, Any]]], generated_on: str) -> str:
+    """Render user stories as Markdown."""
+    parts = [
+        _MD_HEADER,
+        f"*Generated on: {generated_on}*\n\n",
+        "---\n\n"
+    ]
+    for i, story in enumerate(user_stories, 1):
+        # Handle both string and object formats
+        story_text = story if isinstance(story, str) else story.get("story", str(story))
+        parts.append(f"## {i}. {story_text}\n\n")
+
+        # Add acceptance criteria if available
+        if isinstance(story, dict) and "acceptance_criteria" in story and story["acceptance_criteria"]:
+            parts.append("### Acceptance Criteria:\n\n")
+            for j, criteria in enumerate(story["acceptance_criteria"], 1):
+                parts.append(f"{j}. {criteria}\n")
+            parts.append("\n")
+        parts.append("---\n\n")
+    return "".join(parts)
+
+
+# Text renderers dispatched by format; PDF is handled separately because
+# it runs in the worker pool
+_TEXT_RENDERERS = {
+    "txt": (_render_txt, "text/plain"),
+    "md": (_render_md, "text/markdown"),
+}
+
+
+def _render_pdf(user_stories: List[Union[str, Dict[str, Any]]], generated_on: str) -> bytes:
+    """Render user stories to PDF bytes. Runs in a worker thread."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    story = []
+
+    # Title
+    story.append(Paragraph("USER STORIES WITH ACCEPTANCE CRITERIA", _PDF_TITLE_STYLE))
+    story.append(Spacer(1, 20))
+
+    # Date
+    story.append(Paragraph(f"Generated on: {generated_on}", _PDF_BASE_STYLES['Normal']))
+    story.append(Spacer(1, 30))
+
+    # User stories
+    for i, user_story in enumerate(user_stories, 1):
+        # Handle both string and object formats
+        story_text_content = user_story if isinstance(user_story, str) else user_story.get("story", str(user_story))
+        story.append(Paragraph(f"{i}. {story_text_content}", _PDF_STORY_STYLE))
+
+        # Add acceptance criteria if available
+        if isinstance(user_story, dict) and "acceptance_criteria" in user_story and user_story["acceptance_criteria"]:
+            story.append(Paragraph("Acceptance Criteria:", _PDF_BASE_STYLES['Heading3']))
+            for criteria in user_story["acceptance_criteria"]:
+                story.append(Paragraph(f"• {criteria}", _PDF_CRITERIA_STYLE))
+
+        story.append(Spacer(1, 20))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+class PathAwareGZipMiddleware:
+    """GZip middleware that leaves the SSE endpoints uncompressed.
+
+    Starlette's GZipMiddleware compresses streaming responses regardless
+    of content type, and zlib buffers the small data: frames internally —
+    progress events would only arrive once enough bytes accumulate, which
+    defeats the point of the stream endpoints.
+    """
+
+    def __init__(self, app, exclude_paths=(), **gzip_options):
+        self.app = app
+        self.gzip = GZipMiddleware(app, **gzip_options)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes with orjson instead of stdlib json.
+
+    default=str keeps ObjectId (and anything else MongoDB hands back)
+    serializable without a jsonable_encoder pass; orjson already emits
+    datetimes natively.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=str)
+
+
+def _json_response(data: dict) -> Response:
+    """Serialize a payload straight to JSON bytes, skipping jsonable_encoder.
+
+    orjson handles datetimes natively; default=str covers ObjectId and
+    anything else MongoDB hands back.
+    """
+    return Response(orjson.dumps(data, default=str), media_type="application/json")
+
+
+# Response timestamps only need second precision; reuse one string for
+# ~100 ms at a time so high-RPS polling doesn't allocate a fresh
+# datetime + isoformat pair per request
+_iso_now_cache = (0.0, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time in ISO format, cached for about 100 ms."""
+    global _iso_now_cache
+    now = time.monotonic()
+    if now - _iso_now_cache[0] > 0.1:
+        _iso_now_cache = (
+            now,
+            datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(timespec="seconds")
+        )
+    return _iso_now_cache[1]
+
+
+class GenerateStoriesRequest(BaseModel):
+    """Request body for the generate-user-stories endpoint."""
+
+    requirements: str = Field(min_length=10)
+
+    @field_validator("requirements", mode="before")
+    @classmethod
+    def _strip_requirements(cls, value):
+        # Strip before min_length runs so whitespace padding can't
+        # sneak a too-short string past validation
+        return value.strip() if isinstance(value, str) else value
+
+
+class AnalyzeRequirementsRequest(BaseModel):
+    """Request body for the analyze-requirements endpoint."""
+
+    requirements: str = Field(min_length=10)
+
+    @field_validator("requirements", mode="before")
+    @classmethod
+    def _strip_requirements(cls, value):
+        return value.strip() if isinstance(value, str) else value
+
+
+class DownloadStoriesRequest(BaseModel):
+    """Request body for the download-user-stories endpoint."""
+
+    user_stories: List[Union[str, Dict[str, Any]]] = Field(min_length=1)
+    format: Literal["txt", "md", "pdf"]
+
+    @field_validator("format", mode="before")
+    @classmethod
+    def _normalize_format(cls, value):
+        """Accept uppercase format names from older clients."""
+        return value.lower() if isinstance(value, str) else value
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description="AI-powered user story generation from business requirements with Jira integration",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware. Explicit origins (instead of a wildcard) and a
+# max_age let browsers cache the preflight response for 24 hours.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
+    allow_origins=[origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    expose_headers=["Content-Disposition"],
+    max_age=86400,
 )
 
+# Compress large JSON/text responses; small bodies and already-compressed
+# payloads (PDF streaming) are left alone by the minimum_size threshold,
+# and the SSE endpoints skip gzip entirely so frames flush immediately.
+app.add_middleware(
+    PathAwareGZipMiddleware,
+    exclude_paths=("/generate-user-stories/stream", "/jira/export-stories/stream"),
+    minimum_size=1024,
+    compresslevel=5,
+)
+
+# Per-IP rate limits on the endpoints that spend money (LLM tokens) or
+# upstream quota (Atlassian API). The admission controller caps in-flight
+# Jira work; these caps requests over time.
+limiter = Limiter(key_func=get_remote_address)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
 # Initialize services
 try:
     openrouter_service = OpenRouterService()
     logger.info("✅ OpenRouter service initialized successfully")
 except Exception as e:
-    logger.error(f"❌ Failed to initialize OpenRouter service: {e}")
+    logger.error("❌ Failed to initialize OpenRouter service: %s", e)
     openrouter_service = None
 
 try:
     mongodb_service = MongoDBService()
     logger.info("✅ MongoDB service initialized successfully")
 except Exception as e:
-    logger.error(f"❌ Failed to initialize MongoDB service: {e}")
+    logger.error("❌ Failed to initialize MongoDB service: %s", e)
     mongodb_service = None
 
-try:
-    jira_service = JiraService()
-    logger.info("✅ Jira service initialized successfully")
-except Exception as e:
-    logger.error(f"❌ Failed to initialize Jira service: {e}")
-    jira_service = None
+# Keep references to fire-and-forget tasks so they are not garbage
+# collected mid-flight
+_BG_TASKS: set = set()
+
+
+def _on_background_save_done(task: asyncio.Task) -> None:
+    """Drop the task reference and log a failed background save."""
+    _BG_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("⚠️ Background MongoDB save failed: %s", task.exception())
+
+
+def _save_stories_in_background(document: Dict[str, Any]) -> None:
+    """Schedule a MongoDB save without blocking the response."""
+    task = asyncio.create_task(mongodb_service.save_user_stories(document))
+    _BG_TASKS.add(task)
+    task.add_done_callback(_on_background_save_done)
+
+
+# After a failed Jira init (e.g. Jira simply not configured), don't
+# retry — and re-log the full failure — on every request
+_JIRA_INIT_RETRY_SECONDS = 30.0
+_jira_init_failed_at = 0.0
+
+
+def _jira() -> Optional[JiraService]:
+    """Get the shared Jira service, or None if it cannot be initialized.
+
+    Failures are cached for a cooldown window so an unconfigured Jira
+    doesn't re-run (and re-log) the failing constructor per request.
+    """
+    global _jira_init_failed_at
+    if _jira_init_failed_at and time.monotonic() - _jira_init_failed_at < _JIRA_INIT_RETRY_SECONDS:
+        return None
+    try:
+        jira_service = get_jira_service()
+        _jira_init_failed_at = 0.0
+        return jira_service
+    except Exception as e:
+        _jira_init_failed_at = time.monotonic()
+        logger.error("❌ Failed to initialize Jira service (next attempt in %.0fs): %s",
+                     _JIRA_INIT_RETRY_SECONDS, e)
+        return None
+
+
+def require_jira() -> JiraService:
+    """Dependency returning the live Jira service, or raising 503."""
+    jira_service = _jira()
+    if jira_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Jira service is not available. Please check your configuration."
+        )
+    return jira_service
+
+
+def require_mongo() -> MongoDBService:
+    """Dependency returning the live MongoDB service, or raising 503."""
+    if not mongodb_service:
+        raise HTTPException(status_code=503, detail="MongoDB service not available")
+    return mongodb_service
 
 
-@app.get("/", response_model=dict)
+@app.on_event("startup")
+async def create_mongodb_indexes():
+    """Ensure MongoDB indexes without blocking startup."""
+    if mongodb_service is not None:
+        task = asyncio.create_task(mongodb_service.ensure_indexes())
+        _BG_TASKS.add(task)
+        task.add_done_callback(_BG_TASKS.discard)
+
+
+@app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
+    return _json_response({
         "message": "User Story Creation Agent API",
         "version": "1.0.0",
         "docs": "/docs",
         "health": "/health",
         "status": "running"
-    }
+    })
+
 
+# Orchestrators poll /health every few seconds per replica; serve a
+# cached healthy response for up to a second instead of rebuilding it
+_HEALTH_TTL = 1.0
+_health_cache = (0.0, b"")
 
-@app.get("/health", response_model=dict)
+
+@app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    global _health_cache
+    cached_at, cached_body = _health_cache
+    if time.monotonic() - cached_at < _HEALTH_TTL:
+        return Response(cached_body, media_type="application/json")
+
+    timestamp = _iso_now()
     try:
         # Test OpenRouter service
         if openrouter_service is None:
-            return {
+            return _json_response({
                 "status": "unhealthy",
                 "api": "disconnected",
                 "error": "OpenRouter service not initialized",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        
+                "timestamp": timestamp
+            })
+
         # Test MongoDB service
         mongodb_status = "connected" if mongodb_service else "disconnected"
-        
+
         # Test Jira service
-        jira_status = "connected" if jira_service else "disconnected"
-        
-        return {
+        jira_status = "connected" if _jira() else "disconnected"
+
+        body = orjson.dumps({
             "status": "healthy",
             "api": "connected",
             "model": settings.openrouter_model,
             "mongodb": mongodb_status,
             "jira": jira_status,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": timestamp
+        })
+        # Only cache healthy responses so failures surface immediately
+        _health_cache = (time.monotonic(), body)
+        return Response(body, media_type="application/json")
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
+        logger.error("Health check failed: %s", e)
+        _health_cache = (0.0, b"")
+        return _json_response({
             "status": "unhealthy",
             "api": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": timestamp
+        })
 
 
 @app.get("/test-download")
@@ -124,24 +478,25 @@ async def test_download():
             headers={"Content-Disposition": "attachment; filename=test.txt"}
         )
     except Exception as e:
-        logger.error(f"Test download failed: {e}")
+        logger.error("Test download failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/generate-user-stories")
-async def generate_user_stories(request: Request):
+@limiter.limit("5/minute")
+async def generate_user_stories(request: Request, body: GenerateStoriesRequest):
     """
     Generate user stories from business requirements using AI.
-    
+
     This endpoint takes project requirements and uses OpenRouter API to generate
     actionable user stories in the format: "As a <role>, I want <feature> so that <reason>."
-    
+
     Args:
-        request: FastAPI request object containing JSON data
-        
+        body: Validated request body with the project requirements
+
     Returns:
         JSON response with generated user stories
-        
+
     Raises:
         HTTPException: If generation fails or requirements are invalid
     """
@@ -149,101 +504,101 @@ async def generate_user_stories(request: Request):
         # Check if service is available
         if openrouter_service is None:
             raise HTTPException(
-                status_code=503, 
+                status_code=503,
                 detail="OpenRouter service is not available. Please check your configuration."
             )
+
+        requirements = body.requirements
+
+        logger.debug("Generating user stories for requirements: %.100s...", requirements)
         
-        # Parse request body
-        try:
-            body = await request.json()
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request body")
-        
-        # Validate request
-        if not body:
-            raise HTTPException(status_code=422, detail="Request body is empty")
-        
-        if "requirements" not in body:
-            raise HTTPException(status_code=422, detail="Missing 'requirements' field")
-        
-        requirements = body["requirements"]
-        if not requirements or not isinstance(requirements, str):
-            raise HTTPException(status_code=422, detail="Requirements must be a non-empty string")
-        
-        if len(requirements.strip()) < 10:
-            raise HTTPException(
-                status_code=422, 
-                detail="Requirements must be at least 10 characters long"
-            )
-        
-        logger.info(f"Generating user stories for requirements: {requirements[:100]}...")
-        
-        # Generate user stories using OpenRouter (synchronous call)
-        try:
-            result = openrouter_service.generate_user_stories(requirements)
-            
-            if not result or "stories" not in result or len(result["stories"]) == 0:
-                raise Exception("No user stories were generated")
-            
-            logger.info(f"Successfully generated {len(result['stories'])} user stories with acceptance criteria")
-            
-            # Save to MongoDB if available
-            story_id = None
-            if mongodb_service:
-                try:
-                    response_data = {
-                        "user_stories": result["stories"],
-                        "requirements": requirements,
-                        "created_at": datetime.utcnow().isoformat(),
-                        "model": settings.openrouter_model,
-                        "status": "success"
-                    }
-                    story_id = await mongodb_service.save_user_stories(response_data)
-                    logger.info(f"✅ Saved user stories to MongoDB with ID: {story_id}")
-                except Exception as db_error:
-                    logger.warning(f"⚠️ Failed to save to MongoDB: {db_error}")
-                    story_id = f"story_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-            else:
-                story_id = f"story_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-            
-            # Return response
-            response_data = {
-                "user_stories": result["stories"],
-                "id": story_id,
-                "created_at": datetime.utcnow().isoformat(),
-                "model": settings.openrouter_model,
-                "status": "success"
-            }
-            
-            return JSONResponse(content=response_data)
-            
-        except Exception as api_error:
-            logger.error(f"OpenRouter API error: {api_error}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Failed to generate user stories: {str(api_error)}"
+        # The OpenRouter client is async, so the slow LLM call awaits
+        # without tying up a worker thread
+        result = await openrouter_service.generate_user_stories(requirements)
+
+        if not result or "stories" not in result or len(result["stories"]) == 0:
+            raise Exception("No user stories were generated")
+
+        logger.info("Successfully generated %d user stories with acceptance criteria", len(result["stories"]))
+
+        now = datetime.now(timezone.utc)
+        story_id = f"story_{now.strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+
+        # Build the response once; the MongoDB document is the same
+        # payload plus the original requirements
+        response_data = {
+            "user_stories": result["stories"],
+            "created_at": now.isoformat(),
+            "model": settings.openrouter_model,
+            "status": "success"
+        }
+
+        # Persist in the background; the response does not need to
+        # wait for the MongoDB ack
+        if mongodb_service is not None:
+            _save_stories_in_background(
+                {**response_data, "_id": story_id, "requirements": requirements}
             )
-        
+
+        response_data["id"] = story_id
+
+        return ORJSONResponse(response_data)
+
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error generating user stories: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error generating user stories: %s", e)
         raise HTTPException(
-            status_code=500, 
-            detail=f"Internal server error: {str(e)}"
+            status_code=500,
+            detail=f"Failed to generate user stories: {str(e)}"
+        )
+
+
+@app.post("/generate-user-stories/stream")
+@limiter.limit("5/minute")
+async def generate_user_stories_stream(request: Request, body: GenerateStoriesRequest):
+    """
+    Generate user stories, streaming each one as a Server-Sent Event.
+
+    Emits one data frame per story as the model finishes it, plus a final
+    'done' event with the total, so clients can render stories as they
+    arrive instead of waiting out the whole completion.
+    """
+    if openrouter_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="OpenRouter service is not available. Please check your configuration."
         )
 
+    requirements = body.requirements
+
+    async def event_stream():
+        total = 0
+        try:
+            async for story in openrouter_service.generate_user_stories_stream(requirements):
+                total += 1
+                yield b"data: " + orjson.dumps(story) + b"\n\n"
+            done = {"total_stories": total, "model": settings.openrouter_model, "status": "success"}
+            yield b"event: done\ndata: " + orjson.dumps(done) + b"\n\n"
+        except Exception as e:
+            logger.exception("Error streaming user stories: %s", e)
+            yield b"event: error\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 @app.post("/analyze-requirements")
-async def analyze_requirements(request: Request):
+async def analyze_requirements(body: AnalyzeRequirementsRequest):
     """
     Analyze project requirements and estimate the number of user stories that will be generated.
-    
+
     Args:
-        request: FastAPI request object containing JSON data with requirements
-        
+        body: Validated request body with the project requirements
+
     Returns:
         JSON response with analysis results and estimated story count
     """
@@ -251,34 +606,13 @@ async def analyze_requirements(request: Request):
         # Check if service is available
         if openrouter_service is None:
             raise HTTPException(
-                status_code=503, 
+                status_code=503,
                 detail="OpenRouter service is not available. Please check your configuration."
             )
-        
-        # Parse request body
-        try:
-            body = await request.json()
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request body")
-        
-        # Validate request
-        if not body:
-            raise HTTPException(status_code=422, detail="Request body is empty")
-        
-        if "requirements" not in body:
-            raise HTTPException(status_code=422, detail="Missing 'requirements' field")
-        
-        requirements = body["requirements"]
-        if not requirements or not isinstance(requirements, str):
-            raise HTTPException(status_code=422, detail="Requirements must be a non-empty string")
-        
-        if len(requirements.strip()) < 10:
-            raise HTTPException(
-                status_code=422, 
-                detail="Requirements must be at least 10 characters long"
-            )
-        
-        logger.info(f"Analyzing requirements: {requirements[:100]}...")
+
+        requirements = body.requirements
+
+        logger.debug("Analyzing requirements: %.100s...", requirements)
         
         # Analyze requirements complexity
         word_count = len(requirements.split())
@@ -298,8 +632,7 @@ async def analyze_requirements(request: Request):
             complexity_score = 4  # Very Complex
         
         # Adjust based on technical terms and features mentioned
-        technical_terms = ['api', 'database', 'authentication', 'authorization', 'integration', 'workflow', 'reporting', 'dashboard', 'notification', 'payment', 'search', 'filter', 'export', 'import']
-        feature_count = sum(1 for term in technical_terms if term.lower() in requirements.lower())
+        feature_count = len(_TECH_RE.findall(requirements))
         
         if feature_count > 5:
             complexity_score = min(4, complexity_score + 1)
@@ -329,230 +662,111 @@ async def analyze_requirements(request: Request):
                 "estimated_max_stories": estimate["max"],
                 "recommended_approach": f"Based on the complexity, expect {estimate['min']}-{estimate['max']} user stories"
             },
-            "analysis_timestamp": datetime.utcnow().isoformat(),
+            "analysis_timestamp": _iso_now(),
             "status": "success"
         }
         
-        logger.info(f"Requirements analysis completed: {estimate['complexity']} complexity, {estimate['min']}-{estimate['max']} stories estimated")
+        logger.info("Requirements analysis completed: %s complexity, %s-%s stories estimated", estimate["complexity"], estimate["min"], estimate["max"])
         
-        return JSONResponse(content=analysis_result)
+        return ORJSONResponse(analysis_result)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error analyzing requirements: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected error analyzing requirements: %s", e)
         raise HTTPException(
             status_code=500, 
             detail=f"Internal server error: {str(e)}"
         )
 
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc):
+    """Map request validation failures to the existing 422 detail format."""
+    errors = exc.errors()
+    if errors:
+        first = errors[0]
+        field = ".".join(str(part) for part in first["loc"] if part != "body")
+        detail = f"{field}: {first['msg']}" if field else first["msg"]
+    else:
+        detail = "Invalid request body"
+    return ORJSONResponse(status_code=422, content={"detail": detail})
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled exceptions."""
-    logger.error(f"Unhandled exception: {exc}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
+    logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error", 
             "error_code": "INTERNAL_ERROR",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _iso_now()
         }
     )
 
 
 @app.post("/download-user-stories")
-async def download_user_stories(request: Request):
+async def download_user_stories(body: DownloadStoriesRequest):
     """
     Download user stories in different formats (TXT, MD, PDF).
-    
+
     Args:
-        request: FastAPI request object containing JSON data with user stories and format
-        
+        body: Validated request body with user stories and the desired format
+
     Returns:
         JSON response with file content and metadata
     """
     try:
-        logger.info("Download endpoint called")
-        
-        # Parse request body
-        try:
-            body = await request.json()
-            logger.info(f"Request body parsed successfully")
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            raise HTTPException(status_code=400, detail="Invalid JSON in request body")
-        
-        # Validate request
-        if not body:
-            logger.error("Empty request body")
-            raise HTTPException(status_code=422, detail="Request body is empty")
-        
-        if "user_stories" not in body:
-            logger.error("Missing user_stories field")
-            raise HTTPException(status_code=422, detail="Missing 'user_stories' field")
-        
-        if "format" not in body:
-            logger.error("Missing format field")
-            raise HTTPException(status_code=422, detail="Missing 'format' field")
-        
-        user_stories = body["user_stories"]
-        format_type = body["format"].lower()
-        
-        logger.info(f"Processing {len(user_stories)} stories in {format_type} format")
-        
-        if not user_stories or not isinstance(user_stories, list):
-            logger.error("Invalid user_stories format")
-            raise HTTPException(status_code=422, detail="User stories must be a non-empty list")
-        
-        if format_type not in ["txt", "md", "pdf"]:
-            logger.error(f"Invalid format: {format_type}")
-            raise HTTPException(status_code=422, detail="Format must be 'txt', 'md', or 'pdf'")
-        
+        logger.debug("Download endpoint called")
+
+        user_stories = body.user_stories
+        format_type = body.format
+
+        logger.debug("Processing %d stories in %s format", len(user_stories), format_type)
+
         # Generate filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"user_stories_{timestamp}.{format_type}"
-        logger.info(f"Generated filename: {filename}")
+        now = datetime.now(timezone.utc)
+        filename = f"user_stories_{now.strftime('%Y%m%d_%H%M%S')}.{format_type}"
+        logger.debug("Generated filename: %s", filename)
         
         # Create content based on format
-        if format_type == "txt":
-            logger.info("Creating TXT content")
-            content = "USER STORIES\n"
-            content += "=" * 50 + "\n\n"
-            for i, story in enumerate(user_stories, 1):
-                # Handle both string and object formats
-                story_text = story if isinstance(story, str) else story.get("story", str(story))
-                content += f"{i}. {story_text}\n\n"
-                
-                # Add acceptance criteria if available
-                if isinstance(story, dict) and "acceptance_criteria" in story and story["acceptance_criteria"]:
-                    content += "   Acceptance Criteria:\n"
-                    for j, criteria in enumerate(story["acceptance_criteria"], 1):
-                        content += f"   {j}. {criteria}\n"
-                    content += "\n"
-            
-            logger.info("TXT content created successfully")
-            return JSONResponse(content={
-                "content": content,
-                "filename": filename,
-                "format": "txt",
-                "mime_type": "text/plain"
-            })
-        
-        elif format_type == "md":
-            logger.info("Creating MD content with criteria")
-            content = "# User Stories with Acceptance Criteria\n\n"
-            content += f"*Generated on: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}*\n\n"
-            content += "---\n\n"
-            
-            for i, story in enumerate(user_stories, 1):
-                # Handle both string and object formats
-                story_text = story if isinstance(story, str) else story.get("story", str(story))
-                content += f"## {i}. {story_text}\n\n"
-                
-                # Add acceptance criteria if available
-                if isinstance(story, dict) and "acceptance_criteria" in story and story["acceptance_criteria"]:
-                    content += "### Acceptance Criteria:\n\n"
-                    for j, criteria in enumerate(story["acceptance_criteria"], 1):
-                        content += f"{j}. {criteria}\n"
-                    content += "\n"
-                content += "---\n\n"
-            
-            return JSONResponse(content={
-                "content": content,
-                "filename": filename,
-                "format": "md",
-                "mime_type": "text/markdown"
-            })
-        
+        if format_type in _TEXT_RENDERERS:
+            logger.debug("Creating %s content", format_type)
+            renderer, media_type = _TEXT_RENDERERS[format_type]
+            content = renderer(user_stories, now.strftime('%Y-%m-%d %H:%M:%S UTC'))
+            return Response(
+                content.encode('utf-8'),
+                media_type=media_type,
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+            )
+
         elif format_type == "pdf":
-            try:
-                # Import reportlab for PDF generation
-                from reportlab.lib.pagesizes import letter
-                from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-                from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-                from reportlab.lib.units import inch
-                
-                # Create PDF content
-                buffer = io.BytesIO()
-                doc = SimpleDocTemplate(buffer, pagesize=letter)
-                story = []
-                
-                # Styles
-                styles = getSampleStyleSheet()
-                title_style = ParagraphStyle(
-                    'CustomTitle',
-                    parent=styles['Heading1'],
-                    fontSize=16,
-                    spaceAfter=30,
-                    alignment=1  # Center alignment
+            if not _REPORTLAB_OK:
+                raise HTTPException(
+                    status_code=500,
+                    detail="PDF generation requires reportlab library. Please install it with: pip install reportlab"
                 )
-                story_style = ParagraphStyle(
-                    'CustomStory',
-                    parent=styles['Normal'],
-                    fontSize=12,
-                    spaceAfter=20,
-                    leftIndent=20
+
+            try:
+                # Render off the event loop; reportlab is CPU-bound pure Python
+                pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                    _PDF_EXECUTOR,
+                    _render_pdf,
+                    user_stories,
+                    now.strftime('%Y-%m-%d %H:%M:%S UTC')
                 )
-                criteria_style = ParagraphStyle(
-                    'CustomCriteria',
-                    parent=styles['Normal'],
-                    fontSize=11,
-                    spaceAfter=15,
-                    leftIndent=40,
-                    bulletIndent=20
+
+                # Stream the raw PDF bytes instead of base64-encoding into JSON
+                return StreamingResponse(
+                    io.BytesIO(pdf_bytes),
+                    media_type="application/pdf",
+                    headers={"Content-Disposition": f'attachment; filename="{filename}"'}
                 )
                 
-                # Title
-                story.append(Paragraph("USER STORIES WITH ACCEPTANCE CRITERIA", title_style))
-                story.append(Spacer(1, 20))
-                
-                # Date
-                date_text = f"Generated on: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                story.append(Paragraph(date_text, styles['Normal']))
-                story.append(Spacer(1, 30))
-                
-                # User stories
-                for i, user_story in enumerate(user_stories, 1):
-                    # Handle both string and object formats
-                    story_text_content = user_story if isinstance(user_story, str) else user_story.get("story", str(user_story))
-                    story_text = f"{i}. {story_text_content}"
-                    story.append(Paragraph(story_text, story_style))
-                    
-                    # Add acceptance criteria if available
-                    if isinstance(user_story, dict) and "acceptance_criteria" in user_story and user_story["acceptance_criteria"]:
-                        story.append(Paragraph("Acceptance Criteria:", styles['Heading3']))
-                        for j, criteria in enumerate(user_story["acceptance_criteria"], 1):
-                            criteria_text = f"• {criteria}"
-                            story.append(Paragraph(criteria_text, criteria_style))
-                    
-                    story.append(Spacer(1, 20))
-                
-                # Build PDF
-                doc.build(story)
-                buffer.seek(0)
-                
-                # Return PDF as base64 encoded string
-                import base64
-                pdf_content = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                
-                return JSONResponse(content={
-                    "content": pdf_content,
-                    "filename": filename,
-                    "format": "pdf",
-                    "mime_type": "application/pdf",
-                    "encoding": "base64"
-                })
-                
-            except ImportError:
-                raise HTTPException(
-                    status_code=500, 
-                    detail="PDF generation requires reportlab library. Please install it with: pip install reportlab"
-                )
             except Exception as e:
-                logger.error(f"PDF generation error: {e}")
+                logger.error("PDF generation error: %s", e)
                 raise HTTPException(
                     status_code=500, 
                     detail=f"PDF generation failed: {str(e)}"
@@ -561,8 +775,7 @@ async def download_user_stories(request: Request):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error downloading user stories: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error downloading user stories: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to download user stories: {str(e)}"
@@ -573,227 +786,378 @@ async def download_user_stories(request: Request):
 # JIRA INTEGRATION ENDPOINTS
 # ============================================================================
 
-@app.get("/jira/health", response_model=dict)
+# The Jira health probe is a live round-trip to Atlassian; cache healthy
+# results so monitoring polls don't burn sockets and upstream quota
+HEALTH_CACHE_TTL = int(os.getenv("HEALTH_CACHE_TTL", "30"))
+_jira_health_cache = {"ts": 0.0, "payload": None}
+
+
+def _jira_health_response(payload: dict, cache_state: str) -> Response:
+    """Serialize a Jira health payload with cache diagnostics headers."""
+    headers = {"X-Cache": cache_state}
+    if cache_state != "STALE":
+        headers["Cache-Control"] = f"max-age={HEALTH_CACHE_TTL}"
+    return Response(orjson.dumps(payload), media_type="application/json", headers=headers)
+
+
+@app.get("/jira/health")
 async def jira_health_check():
     """Health check for Jira service."""
+    cached = _jira_health_cache["payload"]
+    if cached is not None and time.monotonic() - _jira_health_cache["ts"] < HEALTH_CACHE_TTL:
+        return _jira_health_response(cached, "HIT")
+
     try:
+        jira_service = _jira()
         if jira_service is None:
-            return {
+            return _jira_health_response({
                 "status": "unhealthy",
                 "service": "jira",
                 "error": "Jira service not initialized",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        
+                "timestamp": _iso_now()
+            }, "MISS")
+
         # Test Jira connection
-        health_result = jira_service.health_check()
-        
+        async with jira_admission.slot():
+            health_result = await _in_jira_pool(jira_service.health_check)
+
         if health_result["status"] == "healthy":
-            return {
+            payload = {
                 "status": "healthy",
                 "service": "jira",
                 "connection": "connected",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _iso_now()
             }
+            # Only cache healthy results so recovery checks stay live
+            _jira_health_cache["ts"] = time.monotonic()
+            _jira_health_cache["payload"] = payload
+            return _jira_health_response(payload, "MISS")
         else:
-            return {
+            return _jira_health_response({
                 "status": "unhealthy",
                 "service": "jira",
                 "connection": "failed",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
+                "timestamp": _iso_now()
+            }, "MISS")
+
     except Exception as e:
-        logger.error(f"Jira health check failed: {e}")
-        return {
+        logger.error("Jira health check failed: %s", e)
+        # Fall back to the last good status rather than flapping on a
+        # transient upstream error
+        if cached is not None:
+            return _jira_health_response({**cached, "cache": "stale"}, "STALE")
+        return _jira_health_response({
             "status": "unhealthy",
             "service": "jira",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": _iso_now()
+        }, "MISS")
+
+
+class JiraConfigRequest(BaseModel):
+    """Request body for tuning the Jira admission limit."""
+
+    max_concurrency: int = Field(ge=1, le=64)
+
 
+@app.get("/jira/config")
+async def get_jira_config():
+    """Get the current Jira concurrency settings."""
+    return _json_response({
+        "max_concurrency": jira_admission.limit,
+        "active": jira_admission.active
+    })
 
-@app.get("/jira/projects", response_model=dict)
-async def get_jira_projects():
+
+@app.post("/jira/config")
+async def update_jira_config(body: JiraConfigRequest):
+    """Adjust the Jira admission limit at runtime."""
+    await jira_admission.set_limit(body.max_concurrency)
+    logger.info("Jira admission limit set to %d", body.max_concurrency)
+    return _json_response({
+        "status": "success",
+        "max_concurrency": jira_admission.limit
+    })
+
+
+# Jira project/issue-type configuration changes on the order of days;
+# serve cached bodies and fall back to stale data on upstream failures
+JIRA_PROJECTS_CACHE_TTL = int(os.getenv("JIRA_PROJECTS_CACHE_TTL", "60"))
+JIRA_ISSUE_TYPES_CACHE_TTL = int(os.getenv("JIRA_ISSUE_TYPES_CACHE_TTL", "30"))
+
+
+def _cached_json(body: bytes, state: str) -> Response:
+    """Return a cached JSON body with its cache state in X-Cache-Status."""
+    return Response(body, media_type="application/json", headers={"X-Cache-Status": state})
+
+
+@app.get("/jira/projects")
+@limiter.limit("60/minute")
+async def get_jira_projects(request: Request):
     """Get all accessible Jira projects."""
+    cached, state = await jira_response_cache.get("jira:projects", JIRA_PROJECTS_CACHE_TTL)
+    if state == "fresh":
+        return _cached_json(cached, "hit")
+
     try:
+        jira_service = _jira()
         if jira_service is None:
             raise HTTPException(
                 status_code=503,
                 detail="Jira service is not available. Please check your configuration."
             )
-        
-        projects = jira_service.get_projects()
-        
-        return {
+
+        async with jira_admission.slot():
+            projects = await _in_jira_pool(jira_service.get_projects)
+
+        body = orjson.dumps({
             "status": "success",
             "projects": projects,
             "count": len(projects),
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-    except HTTPException:
-        raise
+            "timestamp": _iso_now()
+        })
+        await jira_response_cache.set("jira:projects", body)
+        return _cached_json(body, "miss")
+
     except Exception as e:
-        logger.error(f"Error fetching Jira projects: {e}")
+        # Serve last-known-good data through upstream outages
+        if cached is not None:
+            logger.warning("Serving stale Jira project list after error: %s", e)
+            return _cached_json(cached, "stale")
+        if isinstance(e, HTTPException):
+            raise
+        logger.error("Error fetching Jira projects: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch Jira projects: {str(e)}"
         )
 
 
-@app.get("/jira/projects/{project_key}", response_model=dict)
-async def get_jira_project_details(project_key: str):
+@app.get("/jira/projects/{project_key}")
+async def get_jira_project_details(project_key: str,
+                                   jira_service: JiraService = Depends(require_jira)):
     """Get detailed information about a specific Jira project."""
     try:
-        if jira_service is None:
-            raise HTTPException(
-                status_code=503,
-                detail="Jira service is not available. Please check your configuration."
-            )
-        
-        project_details = jira_service.get_project_details(project_key)
+        async with jira_admission.slot():
+            project_details = await _in_jira_pool(jira_service.get_project_details, project_key)
         
-        return {
+        return _json_response({
             "status": "success",
             "project": project_details,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": _iso_now()
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching project details for {project_key}: {e}")
+        logger.error("Error fetching project details for %s: %s", project_key, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch project details: {str(e)}"
         )
 
 
-@app.get("/jira/projects/{project_key}/issue-types", response_model=dict)
+@app.get("/jira/projects/{project_key}/issue-types")
 async def get_jira_issue_types(project_key: str):
     """Get available issue types for a specific project."""
+    cache_key = f"jira:issue-types:{project_key}"
+    cached, state = await jira_response_cache.get(cache_key, JIRA_ISSUE_TYPES_CACHE_TTL)
+    if state == "fresh":
+        return _cached_json(cached, "hit")
+
     try:
+        jira_service = _jira()
         if jira_service is None:
             raise HTTPException(
                 status_code=503,
                 detail="Jira service is not available. Please check your configuration."
             )
-        
-        issue_types = jira_service.get_issue_types(project_key)
-        
-        return {
+
+        async with jira_admission.slot():
+            issue_types = await _in_jira_pool(jira_service.get_issue_types, project_key)
+
+        body = orjson.dumps({
             "status": "success",
             "project_key": project_key,
             "issue_types": issue_types,
             "count": len(issue_types),
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-    except HTTPException:
-        raise
+            "timestamp": _iso_now()
+        })
+        await jira_response_cache.set(cache_key, body)
+        return _cached_json(body, "miss")
+
     except Exception as e:
-        logger.error(f"Error fetching issue types for {project_key}: {e}")
+        # Serve last-known-good data through upstream outages
+        if cached is not None:
+            logger.warning("Serving stale issue types for %s after error: %s", project_key, e)
+            return _cached_json(cached, "stale")
+        if isinstance(e, HTTPException):
+            raise
+        logger.error("Error fetching issue types for %s: %s", project_key, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch issue types: {str(e)}"
         )
 
 
-@app.post("/jira/export-stories", response_model=dict)
-async def export_stories_to_jira(request: Request):
+class StoryItem(BaseModel):
+    """A single user story in a Jira export request."""
+
+    story: str
+    acceptance_criteria: List[str] = []
+
+
+class ExportStoriesRequest(BaseModel):
+    """Request body for the Jira export endpoints."""
+
+    stories: List[Union[str, StoryItem]] = Field(min_length=1)
+    project_key: str = Field(min_length=1)
+    create_epic: bool = True
+    epic_name: str = "User Stories"
+
+    def stories_as_dicts(self) -> List[Dict[str, Any]]:
+        """Return the stories in the dict shape the Jira service expects.
+
+        Bare strings are coerced to {story, acceptance_criteria} — the
+        Jira service indexes story["story"] everywhere, so passing the
+        string through would fail every item in the export.
+        """
+        return [
+            {"story": story, "acceptance_criteria": []} if isinstance(story, str)
+            else story.model_dump()
+            for story in self.stories
+        ]
+
+
+@app.post("/jira/export-stories")
+@limiter.limit("10/minute")
+async def export_stories_to_jira(request: Request,
+                                 body: ExportStoriesRequest,
+                                 jira_service: JiraService = Depends(require_jira)):
     """
     Export user stories to Jira.
-    
+
     This endpoint takes generated user stories and creates them as issues in Jira,
     optionally creating an epic to group related stories.
     """
     try:
-        if jira_service is None:
-            raise HTTPException(
-                status_code=503,
-                detail="Jira service is not available. Please check your configuration."
-            )
-        
-        # Parse request body
-        try:
-            body = await request.json()
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="Invalid JSON in request body")
-        
-        # Validate request
-        if not body:
-            raise HTTPException(status_code=422, detail="Request body is empty")
-        
-        if "stories" not in body:
-            raise HTTPException(status_code=422, detail="Missing 'stories' field")
-        
-        if "project_key" not in body:
-            raise HTTPException(status_code=422, detail="Missing 'project_key' field")
-        
-        stories = body["stories"]
-        project_key = body["project_key"]
-        create_epic = body.get("create_epic", True)
-        epic_name = body.get("epic_name", "User Stories")
-        
-        if not stories or not isinstance(stories, list):
-            raise HTTPException(status_code=422, detail="Stories must be a non-empty list")
-        
-        if not project_key or not isinstance(project_key, str):
-            raise HTTPException(status_code=422, detail="Project key must be a non-empty string")
-        
-        logger.info(f"Exporting {len(stories)} stories to Jira project: {project_key}")
+        stories = body.stories_as_dicts()
+        project_key = body.project_key
+        create_epic = body.create_epic
+        epic_name = body.epic_name
+
+        logger.info("Exporting %d stories to Jira project: %s", len(stories), project_key)
         
         # Export stories to Jira
-        export_result = jira_service.export_stories_to_jira(
-            stories=stories,
-            project_key=project_key,
-            create_epic=create_epic,
-            epic_name=epic_name
-        )
+        async with jira_admission.slot():
+            export_result = await _in_jira_pool(
+                jira_service.export_stories_to_jira,
+                stories=stories,
+                project_key=project_key,
+                create_epic=create_epic,
+                epic_name=epic_name
+            )
         
-        logger.info(f"Successfully exported {export_result['total_exported']} stories to Jira")
+        logger.info("Successfully exported %s stories to Jira", export_result["total_exported"])
         
-        return {
+        return _json_response({
             "status": "success",
             "message": f"Exported {export_result['total_exported']} stories to Jira",
             "export_result": export_result,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": _iso_now()
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error exporting stories to Jira: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error exporting stories to Jira: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to export stories to Jira: {str(e)}"
         )
 
 
-@app.get("/jira/issues/{issue_key}", response_model=dict)
-async def get_jira_issue_details(issue_key: str):
+@app.post("/jira/export-stories/stream")
+@limiter.limit("10/minute")
+async def export_stories_to_jira_stream(request: Request,
+                                        body: ExportStoriesRequest,
+                                        jira_service: JiraService = Depends(require_jira)):
+    """
+    Export user stories to Jira, streaming progress as Server-Sent Events.
+
+    Emits one data frame per story as it is created, plus a final 'done'
+    event carrying the same aggregate result as /jira/export-stories, so
+    long exports give feedback instead of holding a silent request open.
+    """
+    stories = body.stories_as_dicts()
+    project_key = body.project_key
+    create_epic = body.create_epic
+    epic_name = body.epic_name
+
+    logger.info("Streaming export of %d stories to Jira project: %s", len(stories), project_key)
+
+    async def event_stream():
+        # Hold one admission slot for the whole export so streaming
+        # exports count against the Jira concurrency cap too
+        async with jira_admission.slot():
+            epic = None
+            if create_epic:
+                try:
+                    epic = await _in_jira_pool(
+                        jira_service.create_epic,
+                        project_key,
+                        epic_name,
+                        f"Parent task containing {len(stories)} user stories"
+                    )
+                    yield b"event: epic\ndata: " + orjson.dumps(epic) + b"\n\n"
+                except Exception as e:
+                    logger.error("❌ Failed to create parent task: %s", e)
+                    yield b"event: epic\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+
+            exported = []
+            for i, story in enumerate(stories):
+                try:
+                    created = await _in_jira_pool(jira_service.create_user_story, project_key, story)
+                    exported.append(created)
+                    frame = {"story_index": i, "key": created["key"]}
+                except Exception as e:
+                    logger.error("❌ Failed to create user story %s: %s", i + 1, e)
+                    frame = {"story_index": i, "error": str(e)}
+                yield b"data: " + orjson.dumps(frame) + b"\n\n"
+
+            result = {
+                "total_exported": len(exported),
+                "epic": epic,
+                "stories": exported,
+                "status": "success"
+            }
+            yield b"event: done\ndata: " + orjson.dumps(result) + b"\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/jira/issues/{issue_key}")
+async def get_jira_issue_details(issue_key: str,
+                                 jira_service: JiraService = Depends(require_jira)):
     """Get detailed information about a Jira issue."""
     try:
-        if jira_service is None:
-            raise HTTPException(
-                status_code=503,
-                detail="Jira service is not available. Please check your configuration."
-            )
-        
-        issue_details = jira_service.get_issue_details(issue_key)
+        async with jira_admission.slot():
+            issue_details = await _in_jira_pool(jira_service.get_issue_details, issue_key)
         
-        return {
+        return _json_response({
             "status": "success",
             "issue": issue_details,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+            "timestamp": _iso_now()
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching issue details for {issue_key}: {e}")
+        logger.error("Error fetching issue details for %s: %s", issue_key, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch issue details: {str(e)}"
@@ -802,34 +1166,39 @@ async def get_jira_issue_details(issue_key: str):
 
 # MongoDB endpoints
 @app.get("/user-stories")
-async def get_user_stories(skip: int = 0, limit: int = 10):
-    """Get all user stories with pagination."""
-    if not mongodb_service:
-        raise HTTPException(status_code=503, detail="MongoDB service not available")
-    
+async def get_user_stories(skip: int = 0, limit: int = 10, after_id: Optional[str] = None,
+                           fields: Optional[str] = None,
+                           mongodb_service: MongoDBService = Depends(require_mongo)):
+    """Get all user stories with pagination.
+
+    Pass after_id (the last _id of the previous page) for keyset
+    pagination instead of deep skips, and fields (comma-separated) to
+    override the slim default projection.
+    """
     try:
-        stories = await mongodb_service.get_user_stories(skip, limit)
-        return {"stories": stories, "skip": skip, "limit": limit}
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        stories = await mongodb_service.get_user_stories(
+            skip, limit, after_id=after_id, fields=field_list
+        )
+        return _json_response({"stories": stories, "skip": skip, "limit": limit})
     except Exception as e:
-        logger.error(f"Error fetching user stories: {e}")
+        logger.error("Error fetching user stories: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch user stories: {str(e)}")
 
 
 @app.get("/user-stories/{story_id}")
-async def get_user_story(story_id: str):
+async def get_user_story(story_id: str,
+                         mongodb_service: MongoDBService = Depends(require_mongo)):
     """Get a specific user story by ID."""
-    if not mongodb_service:
-        raise HTTPException(status_code=503, detail="MongoDB service not available")
-    
     try:
         story = await mongodb_service.get_user_story_by_id(story_id)
         if not story:
             raise HTTPException(status_code=404, detail="User story not found")
-        return {"story": story}
+        return _json_response({"story": story})
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching user story {story_id}: {e}")
+        logger.error("Error fetching user story %s: %s", story_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch user story: {str(e)}")
 
 
@@ -2,15 +2,36 @@
 MongoDB service for the User Story Creation Agent.
 """
 import logging
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from typing import List, Dict, Optional, Any
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit, urlunsplit
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Slim default projection for list views; the full document (including
+# the user_stories array) comes back from the by-id lookup
+LIST_PROJECTION = {"_id": 1, "requirements": 1, "created_at": 1, "model": 1, "status": 1}
+
+
+def _encode_uri_credentials(uri: str) -> str:
+    """Percent-encode the username/password in a MongoDB URI.
+
+    Uses urlsplit so special characters in the path, query string or host
+    don't confuse the parsing the way naive split('@') handling does.
+    """
+    parts = urlsplit(uri)
+    if not parts.password:
+        return uri
+    userinfo = f"{quote_plus(parts.username)}:{quote_plus(parts.password)}"
+    netloc = f"{userinfo}@{parts.hostname}"
+    if parts.port:
+        netloc += f":{parts.port}"
+    return urlunsplit(parts._replace(netloc=netloc))
+
 
 class MongoDBService:
     """Service for MongoDB operations."""
@@ -18,48 +39,42 @@ class MongoDBService:
     def __init__(self):
         """Initialize MongoDB connection."""
         try:
-            # Fix MongoDB URI by properly encoding special characters
-            if '@' in settings.mongodb_uri:
-                # Parse the URI and encode the password part
-                uri_parts = settings.mongodb_uri.split('@')
-                if len(uri_parts) == 2:
-                    auth_part = uri_parts[0]
-                    rest_part = uri_parts[1]
-                    
-                    # Extract and encode username and password
-                    if '://' in auth_part:
-                        protocol_part = auth_part.split('://')[0] + '://'
-                        credentials_part = auth_part.split('://')[1]
-                        
-                        if ':' in credentials_part:
-                            username = credentials_part.split(':')[0]
-                            password = credentials_part.split(':')[1]
-                            
-                            # Encode the password
-                            encoded_password = quote_plus(password)
-                            
-                            # Reconstruct the URI
-                            fixed_uri = f"{protocol_part}{username}:{encoded_password}@{rest_part}"
-                            logger.info("✅ Fixed MongoDB URI with encoded password")
-                        else:
-                            fixed_uri = settings.mongodb_uri
-                    else:
-                        fixed_uri = settings.mongodb_uri
-                else:
-                    fixed_uri = settings.mongodb_uri
-            else:
-                fixed_uri = settings.mongodb_uri
-            
-            self.client = AsyncIOMotorClient(fixed_uri)
+            # Percent-encode any special characters in the credentials
+            fixed_uri = _encode_uri_credentials(settings.mongodb_uri)
+
+            # Bounded pool with fast failure detection: the default
+            # 30s server selection timeout would hang /health on a bad
+            # replica, and wire compression shrinks story payloads
+            self.client = AsyncIOMotorClient(
+                fixed_uri,
+                maxPoolSize=50,
+                minPoolSize=5,
+                serverSelectionTimeoutMS=3000,
+                connectTimeoutMS=5000,
+                socketTimeoutMS=20000,
+                compressors="zstd",
+                retryWrites=True,
+                w="majority"
+            )
             self.db = self.client.user_stories_db
             self.stories_collection = self.db.user_stories
             
             logger.info("✅ MongoDB service initialized successfully")
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize MongoDB service: {e}")
+            logger.error("❌ Failed to initialize MongoDB service: %s", e)
             raise
     
+    async def ensure_indexes(self):
+        """Create the indexes the read paths rely on."""
+        try:
+            # Without this the created_at sort in get_user_stories is an
+            # in-memory sort on every call
+            await self.stories_collection.create_index([("created_at", -1)])
+            logger.info("✅ MongoDB indexes ensured")
+        except Exception as e:
+            logger.error("❌ Failed to create MongoDB indexes: %s", e)
+
     async def test_connection(self) -> bool:
         """Test MongoDB connection."""
         try:
@@ -68,10 +83,10 @@ class MongoDBService:
             logger.info("✅ MongoDB connection test successful")
             return True
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
-            logger.error(f"❌ MongoDB connection test failed: {e}")
+            logger.error("❌ MongoDB connection test failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error testing MongoDB connection: {e}")
+            logger.error("❌ Unexpected error testing MongoDB connection: %s", e)
             return False
     
     async def save_user_stories(self, stories_data: Dict[str, Any]) -> str:
@@ -79,35 +94,86 @@ class MongoDBService:
         try:
             result = await self.stories_collection.insert_one(stories_data)
             story_id = str(result.inserted_id)
-            logger.info(f"✅ Saved user stories with ID: {story_id}")
+            logger.info("✅ Saved user stories with ID: %s", story_id)
             return story_id
         except Exception as e:
-            logger.error(f"❌ Failed to save user stories: {e}")
+            logger.error("❌ Failed to save user stories: %s", e)
             raise Exception(f"Failed to save user stories: {str(e)}")
     
-    async def get_user_stories(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get user stories with pagination."""
+    @staticmethod
+    def _with_str_id(doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert the BSON ObjectId _id to a plain string in place."""
+        if doc and "_id" in doc:
+            doc["_id"] = str(doc["_id"])
+        return doc
+
+    async def get_user_stories(self, skip: int = 0, limit: int = 10,
+                               after_id: Optional[str] = None,
+                               fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get user stories with pagination.
+
+        Passing ``after_id`` (the ``_id`` of the last document on the
+        previous page) switches to keyset pagination, which avoids the
+        O(skip) scan that makes deep skip/limit pagination progressively
+        slower. By default only the slim list-view fields are fetched;
+        pass ``fields`` for a custom projection.
+        """
         try:
-            cursor = self.stories_collection.find().skip(skip).limit(limit).sort("created_at", -1)
+            projection = {field: 1 for field in fields} if fields else LIST_PROJECTION
+            if after_id:
+                # The cursor can be an ObjectId hex string or one of the
+                # pre-generated string ids, and _id ordering is type-
+                # bracketed across the two — so anchor the page on
+                # created_at, the field the default sort and index use
+                anchor_id = ObjectId(after_id) if ObjectId.is_valid(after_id) else after_id
+                anchor = await self.stories_collection.find_one(
+                    {"_id": anchor_id}, {"created_at": 1}
+                )
+                if anchor is None:
+                    logger.warning("⚠️ Unknown after_id cursor: %s", after_id)
+                    return []
+                cursor = (
+                    self.stories_collection
+                    .find({"created_at": {"$lt": anchor["created_at"]}},
+                          projection, batch_size=limit)
+                    .sort("created_at", -1)
+                    .limit(limit)
+                )
+            else:
+                cursor = (
+                    self.stories_collection
+                    .find({}, projection, batch_size=limit)
+                    .sort("created_at", -1)
+                    .skip(skip)
+                    .limit(limit)
+                )
             stories = await cursor.to_list(length=limit)
-            logger.info(f"✅ Retrieved {len(stories)} user stories")
-            return stories
+            logger.info("✅ Retrieved %d user stories", len(stories))
+            return [self._with_str_id(story) for story in stories]
         except Exception as e:
-            logger.error(f"❌ Failed to retrieve user stories: {e}")
+            logger.error("❌ Failed to retrieve user stories: %s", e)
             raise Exception(f"Failed to retrieve user stories: {str(e)}")
     
-    async def get_user_story_by_id(self, story_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific user story by ID."""
+    async def get_user_story_by_id(self, story_id: str,
+                                   projection: Optional[Dict[str, int]] = None) -> Optional[Dict[str, Any]]:
+        """Get a specific user story by ID.
+
+        The ``_id`` index serves the lookup either way; pass ``projection``
+        to fetch a subset of fields instead of the full document.
+        """
         try:
-            from bson import ObjectId
-            story = await self.stories_collection.find_one({"_id": ObjectId(story_id)})
+            # is_valid is a cheap pre-check that skips the InvalidId raise
+            # on malformed input; stories saved in the background carry
+            # plain string ids, so those fall back to a literal _id match
+            lookup_id = ObjectId(story_id) if ObjectId.is_valid(story_id) else story_id
+            story = await self.stories_collection.find_one({"_id": lookup_id}, projection)
             if story:
-                logger.info(f"✅ Retrieved user story with ID: {story_id}")
+                logger.info("✅ Retrieved user story with ID: %s", story_id)
             else:
-                logger.warning(f"⚠️ User story with ID {story_id} not found")
-            return story
+                logger.warning("⚠️ User story with ID %s not found", story_id)
+            return self._with_str_id(story)
         except Exception as e:
-            logger.error(f"❌ Failed to retrieve user story: {e}")
+            logger.error("❌ Failed to retrieve user story: %s", e)
             raise Exception(f"Failed to retrieve user story: {str(e)}")
     
     async def close_connection(self):
@@ -116,4 +182,4 @@ class MongoDBService:
             self.client.close()
             logger.info("✅ MongoDB connection closed")
         except Exception as e:
-            logger.error(f"❌ Error closing MongoDB connection: {e}")
+            logger.error("❌ Error closing MongoDB connection: %s", e)
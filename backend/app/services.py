@@ -1,16 +1,78 @@
 """
 Business logic services for the User Story Creation Agent.
 """
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
+import hashlib
 import json
 import logging
-import traceback
-from typing import List
+import os
+import re
+from typing import Any, Dict, List
 
+from .cache import llm_response_cache
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Identical requirements are common for retries and demos; serving the
+# cached story set skips the full OpenRouter token cost
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+
+# Precompiled patterns for the text-fallback parser. One multiline scan
+# over the whole response replaces the old per-line startswith/replace
+# loop, so parsing cost tracks the number of matches, not lines.
+_STORY_RE = re.compile(
+    r'^\s*(?:\d+[.)]\s*)?(?P<story>As an? .+?(?:I want|I need).+?)\s*$',
+    re.MULTILINE,
+)
+_AC_RE = re.compile(
+    r'^\s*(?:\d+[.)]\s*)?[-*]?\s*(?P<ac>Given .+?When .+?Then .+?)\s*$',
+    re.MULTILINE,
+)
+
+# Prompt wrapper is constant; only the requirements vary per call. Keeping
+# the prefix byte-identical across requests also lets providers that dedupe
+# shared prompt prefixes cache it server-side.
+_PROMPT_PREFIX = """Given the following project requirements, generate user stories with acceptance criteria for agile development.
+
+Requirements:
+"""
+
+_PROMPT_SUFFIX = """
+
+Please analyze the requirements and generate an appropriate number of user stories based on the complexity and scope of the project.
+- For simple requirements: Generate 2-4 user stories
+- For medium complexity: Generate 4-6 user stories
+- For complex requirements: Generate 6-10 user stories
+- For very complex projects: Generate 8-15 user stories
+
+The number should be proportional to the scope and complexity of the requirements provided.
+
+Please output ONLY a JSON array of objects. Each object should contain:
+- "story": The user story in format "As a <role>, I want <feature> so that <reason>."
+- "acceptance_criteria": An array of acceptance criteria in "Given... When... Then..." format
+
+Example format:
+[
+    {
+        "story": "As a user, I want to register so that I can have a personal account.",
+        "acceptance_criteria": [
+            "Given I am on the registration page, When I fill in valid email and password, Then I should be able to create an account",
+            "Given I am on the registration page, When I submit with invalid email format, Then I should see an error message",
+            "Given I am on the registration page, When I submit with weak password, Then I should see password strength requirements"
+        ]
+    }
+]
+
+Generate the appropriate number of user stories based on the complexity of the requirements provided, with 3-4 acceptance criteria each.
+"""
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a professional software analyst who creates clear, actionable user stories with acceptance criteria for agile development. You analyze project requirements and determine the appropriate number of user stories based on complexity and scope. For simple projects, generate fewer stories. For complex projects, generate more comprehensive stories. Always respond with valid JSON arrays containing story and acceptance_criteria fields."
+}
+
 
 class OpenRouterService:
     """Service for interacting with OpenRouter API."""
@@ -28,22 +90,27 @@ class OpenRouterService:
             if not settings.openrouter_model:
                 raise ValueError("OPENROUTER_MODEL is not set")
             
-            logger.info(f"Initializing OpenRouter service with model: {settings.openrouter_model}")
+            logger.info("Initializing OpenRouter service with model: %s", settings.openrouter_model)
             
             # Create client
-            self.client = OpenAI(
+            self.client = AsyncOpenAI(
                 base_url=settings.openrouter_base_url,
                 api_key=settings.openrouter_api_key,
+                max_retries=2,
+                timeout=60,
             )
-            
+
+            # Bound in-flight OpenRouter calls so a burst of generation
+            # requests queues here instead of piling onto the provider
+            self._semaphore = asyncio.Semaphore(16)
+
             logger.info("✅ OpenRouter client created successfully")
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize OpenRouter service: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Failed to initialize OpenRouter service: %s", e)
             raise
     
-    def generate_user_stories(self, requirements: str) -> dict:
+    async def generate_user_stories(self, requirements: str) -> dict:
         """
         Generate user stories with acceptance criteria from requirements using OpenRouter API.
         
@@ -64,85 +131,183 @@ class OpenRouterService:
             if len(requirements.strip()) < 10:
                 raise ValueError("Requirements must be at least 10 characters long")
             
-            logger.info(f"Generating user stories with acceptance criteria for requirements: {requirements[:100]}...")
-            
-            # Create prompt
-            prompt = f"""
-            Given the following project requirements, generate user stories with acceptance criteria for agile development.
-            
-            Requirements:
-            {requirements}
-            
-            Please analyze the requirements and generate an appropriate number of user stories based on the complexity and scope of the project. 
-            - For simple requirements: Generate 2-4 user stories
-            - For medium complexity: Generate 4-6 user stories  
-            - For complex requirements: Generate 6-10 user stories
-            - For very complex projects: Generate 8-15 user stories
-            
-            The number should be proportional to the scope and complexity of the requirements provided.
-            
-            Please output ONLY a JSON array of objects. Each object should contain:
-            - "story": The user story in format "As a <role>, I want <feature> so that <reason>."
-            - "acceptance_criteria": An array of acceptance criteria in "Given... When... Then..." format
-            
-            Example format:
-            [
-                {{
-                    "story": "As a user, I want to register so that I can have a personal account.",
-                    "acceptance_criteria": [
-                        "Given I am on the registration page, When I fill in valid email and password, Then I should be able to create an account",
-                        "Given I am on the registration page, When I submit with invalid email format, Then I should see an error message",
-                        "Given I am on the registration page, When I submit with weak password, Then I should see password strength requirements"
-                    ]
-                }}
-            ]
-            
-            Generate the appropriate number of user stories based on the complexity of the requirements provided, with 3-4 acceptance criteria each.
-            """
-            
-            logger.info(f"Making API call to OpenRouter with model: {settings.openrouter_model}")
+            logger.info("Generating user stories with acceptance criteria for requirements: %.100s...", requirements)
+
+            # Serve identical requirements from cache instead of
+            # re-spending tokens on the same prompt
+            cache_key = "us:v1:" + hashlib.sha256(requirements.encode()).hexdigest()
+            cached, cache_state = await llm_response_cache.get(cache_key, LLM_CACHE_TTL)
+            if cache_state == "fresh":
+                logger.info("✅ Serving user stories from cache")
+                return json.loads(cached)
+
+            # Create prompt from the constant wrapper
+            prompt = _PROMPT_PREFIX + requirements + _PROMPT_SUFFIX
+
+            logger.info("Making API call to OpenRouter with model: %s", settings.openrouter_model)
             
             # Make API call
-            response = self.client.chat.completions.create(
-                model=settings.openrouter_model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a professional software analyst who creates clear, actionable user stories with acceptance criteria for agile development. You analyze project requirements and determine the appropriate number of user stories based on complexity and scope. For simple projects, generate fewer stories. For complex projects, generate more comprehensive stories. Always respond with valid JSON arrays containing story and acceptance_criteria fields."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000,
-                extra_headers={
-                    "HTTP-Referer": "http://localhost:3000",
-                    "X-Title": "User Story Creation Agent",
-                }
-            )
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=settings.openrouter_model,
+                    messages=[
+                        _SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=2000,
+                    extra_headers={
+                        "HTTP-Referer": "http://localhost:3000",
+                        "X-Title": "User Story Creation Agent",
+                    }
+                )
             
             # Extract content
             content = response.choices[0].message.content.strip()
-            logger.info(f"Received response from OpenRouter: {content[:200]}...")
+            logger.info("Received response from OpenRouter: %.200s...", content)
             
             # Try to parse JSON response
+            parsed_ok = False
             try:
                 stories_with_criteria = json.loads(content)
                 if isinstance(stories_with_criteria, list) and len(stories_with_criteria) > 0:
-                    logger.info(f"Successfully parsed {len(stories_with_criteria)} user stories with acceptance criteria from JSON")
-                    return {"stories": stories_with_criteria}
+                    logger.info("Successfully parsed %d user stories with acceptance criteria from JSON", len(stories_with_criteria))
+                    result = {"stories": stories_with_criteria}
+                    parsed_ok = True
                 else:
                     logger.warning("Response is not a valid list, extracting from text")
-                    return self._extract_stories_with_criteria_from_text(content)
-                    
+                    result = self._extract_stories_with_criteria_from_text(content)
+
             except json.JSONDecodeError as json_error:
-                logger.warning(f"JSON parsing failed: {json_error}, extracting from text")
-                return self._extract_stories_with_criteria_from_text(content)
-                
+                logger.warning("JSON parsing failed: %s, extracting from text", json_error)
+                result = self._extract_stories_with_criteria_from_text(content)
+
+            # Only cache cleanly parsed story sets; the text fallback can
+            # degrade to a generic placeholder, and serving that for 24h
+            # would pin a bad answer to these requirements
+            if parsed_ok:
+                await llm_response_cache.set(cache_key, json.dumps(result).encode())
+            return result
+
         except Exception as e:
-            logger.error(f"Error generating user stories with acceptance criteria: {e}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error generating user stories with acceptance criteria: %s", e)
             raise Exception(f"Failed to generate user stories with acceptance criteria: {str(e)}")
-    
+
+    async def generate_user_stories_stream(self, requirements: str):
+        """
+        Generate user stories as an async stream.
+
+        Streams the chat completion and yields each {"story",
+        "acceptance_criteria"} object as soon as the model finishes
+        emitting it, instead of waiting for the full max_tokens response.
+        If the stream never produces a parseable object, the accumulated
+        buffer goes through the same text fallback as the blocking path.
+
+        Args:
+            requirements: Project requirements or business description
+
+        Yields:
+            One dictionary per user story
+        """
+        if not requirements or not isinstance(requirements, str):
+            raise ValueError("Requirements must be a non-empty string")
+
+        if len(requirements.strip()) < 10:
+            raise ValueError("Requirements must be at least 10 characters long")
+
+        logger.info("Streaming user stories for requirements: %.100s...", requirements)
+
+        prompt = _PROMPT_PREFIX + requirements + _PROMPT_SUFFIX
+
+        # Bracket-balanced scanner state: each completed top-level {...}
+        # inside the array is parsed on its own, so no re-scan of the
+        # full buffer per chunk
+        buf = ""
+        scan_pos = 0
+        depth = 0
+        in_string = False
+        escaped = False
+        obj_start = -1
+        emitted = 0
+
+        async with self._semaphore:
+            response = await self.client.chat.completions.create(
+                model=settings.openrouter_model,
+                messages=[
+                    _SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=2000,
+                stream=True,
+                extra_headers={
+                    "HTTP-Referer": "http://localhost:3000",
+                    "X-Title": "User Story Creation Agent",
+                }
+            )
+
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buf += delta
+
+                for i in range(scan_pos, len(buf)):
+                    char = buf[i]
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == '\\':
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                        continue
+                    if char == '"':
+                        in_string = True
+                    elif char == '{':
+                        if depth == 0:
+                            obj_start = i
+                        depth += 1
+                    elif char == '}' and depth > 0:
+                        depth -= 1
+                        if depth == 0 and obj_start >= 0:
+                            try:
+                                story = json.loads(buf[obj_start:i + 1])
+                            except json.JSONDecodeError:
+                                story = None
+                            obj_start = -1
+                            if isinstance(story, dict) and "story" in story:
+                                emitted += 1
+                                yield story
+                scan_pos = len(buf)
+
+        if emitted == 0:
+            logger.warning("Stream produced no JSON objects, extracting from text")
+            for story in self._extract_stories_with_criteria_from_text(buf)["stories"]:
+                yield story
+        else:
+            logger.info("Streamed %d user stories with acceptance criteria", emitted)
+
+    async def generate_user_stories_batch(self, requirements_list: List[str]) -> List[Dict[str, Any]]:
+        """
+        Generate user stories for several requirement sets concurrently.
+
+        The per-service semaphore still bounds how many OpenRouter calls
+        are in flight at once, so a large batch fans out without
+        overwhelming the provider.
+
+        Args:
+            requirements_list: List of requirement descriptions
+
+        Returns:
+            List of result dictionaries in the same order as the input
+        """
+        return await asyncio.gather(
+            *[self.generate_user_stories(requirements) for requirements in requirements_list]
+        )
+
     def _extract_stories_with_criteria_from_text(self, text: str) -> dict:
         """
         Extract user stories with acceptance criteria from text response when JSON parsing fails.
@@ -154,53 +319,32 @@ class OpenRouterService:
             Dictionary containing stories with acceptance criteria
         """
         try:
-            lines = text.split('\n')
             stories_with_criteria = []
-            current_story = None
-            current_criteria = []
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Check if line contains a user story
-                if line.startswith('As a ') and ('I want' in line or 'I need' in line):
-                    # Save previous story if exists
-                    if current_story:
-                        stories_with_criteria.append({
-                            "story": current_story,
-                            "acceptance_criteria": current_criteria if current_criteria else [
-                                f"Given the user story '{current_story}', When implemented correctly, Then the feature should work as expected"
-                            ]
-                        })
-                    
-                    # Start new story
-                    current_story = line
-                    current_criteria = []
-                
-                # Check if line contains acceptance criteria
-                elif line.startswith('Given ') and 'When ' in line and 'Then ' in line:
-                    current_criteria.append(line)
-                
-                # Check for numbered criteria
-                elif line and any(char.isdigit() for char in line[:3]) and ('Given ' in line or 'When ' in line or 'Then ' in line):
-                    # Remove numbering
-                    criteria = line
-                    for i in range(1, 10):
-                        criteria = criteria.replace(f"{i}. ", "").replace(f"{i}) ", "")
-                    if criteria.startswith('Given ') or criteria.startswith('When ') or criteria.startswith('Then '):
-                        current_criteria.append(criteria)
-            
-            # Add the last story
-            if current_story:
+            story_matches = list(_STORY_RE.finditer(text))
+
+            for index, match in enumerate(story_matches):
+                story = match.group("story")
+
+                # Acceptance criteria live between this story and the next one
+                window_end = (
+                    story_matches[index + 1].start()
+                    if index + 1 < len(story_matches)
+                    else len(text)
+                )
+                criteria = [
+                    ac_match.group("ac")
+                    for ac_match in _AC_RE.finditer(text, match.end(), window_end)
+                ]
+
                 stories_with_criteria.append({
-                    "story": current_story,
-                    "acceptance_criteria": current_criteria if current_criteria else [
-                        f"Given the user story '{current_story}', When implemented correctly, Then the feature should work as expected"
+                    "story": story,
+                    "acceptance_criteria": criteria if criteria else [
+                        f"Given the user story '{story}', When implemented correctly, Then the feature should work as expected"
                     ]
                 })
-            
+
             if stories_with_criteria:
-                logger.info(f"Extracted {len(stories_with_criteria)} user stories with acceptance criteria from text")
+                logger.info("Extracted %d user stories with acceptance criteria from text", len(stories_with_criteria))
                 return {"stories": stories_with_criteria}
             else:
                 logger.warning("No user stories found in text, returning default")
@@ -215,7 +359,7 @@ class OpenRouterService:
                 }
                 
         except Exception as e:
-            logger.error(f"Error extracting stories with criteria from text: {e}")
+            logger.error("Error extracting stories with criteria from text: %s", e)
             return {
                 "stories": [{
                     "story": "As a user, I want to implement the requirements so that the system meets the business needs.",
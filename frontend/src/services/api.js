@@ -131,32 +131,15 @@ export const downloadUserStories = async (userStories, format) => {
     const response = await api.post('/download-user-stories', {
       user_stories: userStories,
       format: format
-    });
-    
-    // Handle JSON response with content
-    const { content, filename, mime_type, note, encoding } = response.data;
-    
-    // Show note if provided (e.g., PDF fallback to text)
-    if (note) {
-      console.log(note);
-    }
-    
-    let blob;
-    
-    // Handle different content types
-    if (format === 'pdf' && encoding === 'base64') {
-      // Convert base64 PDF content to blob
-      const binaryString = atob(content);
-      const bytes = new Uint8Array(binaryString.length);
-      for (let i = 0; i < binaryString.length; i++) {
-        bytes[i] = binaryString.charCodeAt(i);
-      }
-      blob = new Blob([bytes], { type: 'application/pdf' });
-    } else {
-      // Handle text-based formats
-      blob = new Blob([content], { type: mime_type });
-    }
-    
+    }, { responseType: 'blob' });
+
+    // The backend streams the file bytes directly; take the filename
+    // from the Content-Disposition header
+    const disposition = response.headers['content-disposition'] || '';
+    const match = disposition.match(/filename="?([^"]+)"?/);
+    const filename = match ? match[1] : `user_stories.${format}`;
+    const blob = response.data;
+
     // Create download link
     const url = window.URL.createObjectURL(blob);
     const link = document.createElement('a');